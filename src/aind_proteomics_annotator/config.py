@@ -7,6 +7,10 @@ environment variables so the same binary works on any machine/mount point:
     ANNOTATOR_ANNOTATIONS_ROOT  Path to the annotations directory (default: ./annotations)
     ANNOTATOR_ROLES_FILE        Path to configs/roles.json (default: ./configs/roles.json)
     ANNOTATOR_CLASSES_FILE      Path to configs/classes.json (default: ./configs/classes.json)
+    ANNOTATOR_QUANTIZE_DISPLAY  "1" to display float blocks as uint8 (default: off)
+    ANNOTATOR_MAX_CACHE_MB      Memory budget for cached blocks in MiB
+                                (default: 4096, or a quarter of RAM if smaller)
+    ANNOTATOR_DECODE_PROCESSES  Decode TIFFs in N subprocesses (default: 0, use threads)
 
 Class definitions (configs/classes.json)
 -----------------------------------------
@@ -40,6 +44,16 @@ _DEFAULT_CLASS_DEFS = [
 ]
 
 
+def _default_cache_bytes() -> int:
+    """4 GiB, capped at a quarter of physical RAM where that is known."""
+    budget = 4 * 1024**3
+    try:
+        ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):  # e.g. Windows
+        return budget
+    return min(budget, ram // 4) if ram > 0 else budget
+
+
 @dataclass
 class AppConfig:
     """Centralised application configuration."""
@@ -49,7 +63,13 @@ class AppConfig:
     roles_file: Path
     classes_file: Path
     autoplay_interval_ms: int = 100
-    max_cached_blocks: int = 10 # current block + up to 4 preloaded neighbours
+    # Byte budget for the block cache; the block count is only a backstop so
+    # many small blocks can stay resident for back-navigation.  Whichever cap
+    # is hit first triggers LRU eviction.
+    max_cached_blocks: int = 32
+    max_cache_bytes: int = field(default_factory=_default_cache_bytes)
+    # >0 moves TIFF decoding into that many worker processes (GIL-free).
+    decode_processes: int = 0
     classes: list = field(
         default_factory=lambda: [c["name"] for c in _DEFAULT_CLASS_DEFS]
     )
@@ -57,6 +77,10 @@ class AppConfig:
         default_factory=lambda: [c["color"] for c in _DEFAULT_CLASS_DEFS]
     )
     channel_names: list = field(default_factory=list)
+    # Convert float channels to uint8 (1–99 percentile stretch) in the load
+    # workers, before caching, to cut cache bytes and texture upload
+    # bandwidth 4×; off by default as it fixes contrast.
+    quantize_display: bool = False
 
     @classmethod
     def from_environment(cls) -> "AppConfig":
@@ -84,6 +108,16 @@ class AppConfig:
             classes=[c["name"] for c in class_defs],
             class_colors=[c["color"] for c in class_defs],
             channel_names=channel_names,
+            quantize_display=os.environ.get("ANNOTATOR_QUANTIZE_DISPLAY", "")
+            .strip()
+            .lower()
+            in ("1", "true", "yes"),
+            max_cache_bytes=(
+                int(os.environ["ANNOTATOR_MAX_CACHE_MB"]) * 1024**2
+                if os.environ.get("ANNOTATOR_MAX_CACHE_MB")
+                else _default_cache_bytes()
+            ),
+            decode_processes=int(os.environ.get("ANNOTATOR_DECODE_PROCESSES", "0")),
         )
 
     @staticmethod
@@ -25,8 +25,12 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
-from aind_proteomics_annotator.utils.atomic_io import read_json
-from aind_proteomics_annotator.utils.consensus import build_consensus_table
+from aind_proteomics_annotator.models.annotation_store import (
+    load_annotation_labels,
+    rekey_by_block_id,
+    storage_key,
+)
+from aind_proteomics_annotator.utils.consensus import build_consensus_table_fast
 from aind_proteomics_annotator.utils.csv_exporter import export_csv
 
 # Table status background colours.
@@ -55,6 +59,7 @@ class AdminPanel(QWidget):
 
         self._all_user_data: dict = {}
         self._consensus_rows: list = []
+        self._final_labels: dict = {}  # block_id -> final label entry
         self._selected_block_id: str | None = None
 
         self._build_ui()
@@ -128,19 +133,25 @@ class AdminPanel(QWidget):
     # ------------------------------------------------------------------
 
     def refresh_data(self) -> None:
-        """Re-read all user JSON files from disk and rebuild the table."""
+        """Re-read all user JSON files (and journals) from disk and rebuild the table."""
+        # Make our own debounced annotations visible to the read below.
+        self._session.store.flush(wait=True)
         self._all_user_data = {}
+        block_ids = [b.block_id for b in self._registry.all_blocks()]
+        # Files are keyed by absolute storage path; map back to block ids.
+        block_by_key = {storage_key(b, self._registry): b for b in block_ids}
         users_dir = self._config.users_dir
         if users_dir.exists():
             for f in sorted(users_dir.glob("*.json")):
-                data = read_json(f)
-                if data and "annotations" in data:
-                    self._all_user_data[data["username"]] = data["annotations"]
+                labels = load_annotation_labels(f)
+                if labels is not None:
+                    self._all_user_data[f.stem] = rekey_by_block_id(labels, block_by_key)
 
-        self._session.final_label_store.load()
+        final_label_store = self._session.final_label_store
+        final_label_store.load()
+        self._final_labels = rekey_by_block_id(final_label_store.all_labels(), block_by_key)
 
-        block_ids = [b.block_id for b in self._registry.all_blocks()]
-        self._consensus_rows = build_consensus_table(
+        self._consensus_rows = build_consensus_table_fast(
             self._all_user_data, block_ids
         )
         self._populate_table()
@@ -160,7 +171,7 @@ class AdminPanel(QWidget):
         self._table.setHorizontalHeaderLabels(columns)
         self._table.setRowCount(len(self._consensus_rows))
 
-        final_labels_map = self._session.final_label_store.all_labels()
+        final_labels_map = self._final_labels
 
         for row_idx, row in enumerate(self._consensus_rows):
             # Block ID
@@ -243,7 +254,7 @@ class AdminPanel(QWidget):
             return
         export_csv(
             consensus_rows=self._consensus_rows,
-            final_labels=self._session.final_label_store.all_labels(),
+            final_labels=self._final_labels,
             output_path=Path(path),
             usernames=list(self._all_user_data.keys()),
         )
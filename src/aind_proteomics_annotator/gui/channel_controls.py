@@ -245,6 +245,12 @@ class ChannelControlWidget(QGroupBox):
             prefs["range_hi"] = float(hi)
             prefs["range_min"] = float(self._range_slider.minimum())
             prefs["range_max"] = float(self._range_slider.maximum())
+            layer = self._get_layer()
+            data = _base_data(layer) if layer is not None else None
+            if data is not None:
+                # Ranges are in data units; record which, so a float range
+                # is not applied to quantized uint8 data (or vice versa).
+                prefs["range_dtype"] = str(data.dtype)
         return prefs
 
     # ------------------------------------------------------------------
@@ -315,7 +321,7 @@ class ChannelControlWidget(QGroupBox):
         layer = self._get_layer()
         if layer is None:
             return
-        data = layer.data
+        data = _base_data(layer)
         if data is None or data.size == 0:
             return
         lo = float(np.percentile(data, 1))
@@ -463,7 +469,10 @@ class ChannelControlsPanel(QWidget):
             ch = saved.get(name, {})
             if "color" in ch:
                 widget.apply_color(ch["color"])
-            has_saved_range = "range_lo" in ch and "range_hi" in ch
+            layer = widget._get_layer()
+            has_saved_range = _saved_range_applies(
+                ch, _base_data(layer) if layer is not None else None
+            )
             if has_saved_range:
                 widget.apply_range(
                     ch["range_lo"],
@@ -477,7 +486,7 @@ class ChannelControlsPanel(QWidget):
                     layer = self._viewer.layers[name]
                     widget.set_visibility(bool(getattr(layer, "visible", True)))
                     if not has_saved_range:
-                        data = getattr(layer, "data", None)
+                        data = _base_data(layer)
                         if data is not None and data.size:
                             data_min = float(np.nanmin(data))
                             data_max = float(np.nanmax(data))
@@ -578,6 +587,38 @@ class ChannelControlsPanel(QWidget):
         prefs = {name: w.get_prefs() for name, w in self._widgets.items()}
         from aind_proteomics_annotator.utils.atomic_io import atomic_write_json
         try:
-            atomic_write_json(self._prefs_file, {"channel_prefs": prefs})
+            # UI state: losing the last tweak on a crash is harmless, so
+            # skip the fsyncs but keep the atomic rename.
+            atomic_write_json(
+                self._prefs_file, {"channel_prefs": prefs}, durability="none"
+            )
         except Exception as exc:
             print(f"[ChannelControls] Could not save prefs: {exc}")
+
+
+def _saved_range_applies(ch: dict, data) -> bool:
+    """True if *ch* holds a saved contrast range usable for *data*.
+
+    Ranges tagged with a ``range_dtype`` only apply to data of that dtype.
+    Untagged (older) ranges apply unless they fall outside an integer
+    dtype's bounds, e.g. a float range restored onto quantized uint8 data.
+    """
+    if "range_lo" not in ch or "range_hi" not in ch:
+        return False
+    if data is None:
+        return True
+    saved_dtype = ch.get("range_dtype")
+    if saved_dtype is not None:
+        return saved_dtype == str(data.dtype)
+    if data.dtype.kind in "ui":
+        info = np.iinfo(data.dtype)
+        return info.min <= ch["range_lo"] and ch["range_hi"] <= info.max
+    return True
+
+
+def _base_data(layer):
+    """Return the full-resolution array of *layer* (level 0 if multiscale)."""
+    data = getattr(layer, "data", None)
+    if data is not None and getattr(layer, "multiscale", False):
+        return data[0]
+    return data
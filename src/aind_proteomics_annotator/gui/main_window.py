@@ -30,7 +30,7 @@ napari vispy canvas holds keyboard focus.
 
 from __future__ import annotations
 
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtGui import QKeySequence
 from qtpy.QtWidgets import (
     QMainWindow,
@@ -46,6 +46,10 @@ from aind_proteomics_annotator.gui.bottom_panel import BottomPanel
 from aind_proteomics_annotator.gui.channel_controls import ChannelControlsPanel
 from aind_proteomics_annotator.gui.viewer_panel import ViewerPanel
 
+# Quiet period after the last annotation before its journal record is written,
+# so bursts of keyboard annotations share a single append + fsync.
+_SAVE_DEBOUNCE_MS = 150
+
 
 class MainWindow(QMainWindow):
     """Root application window.
@@ -69,6 +73,13 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"Proteomics Annotator  —  {session.username}")
         self.resize(1600, 950)
 
+        # Coalesce annotation writes; flushed on timeout and on close.
+        self._session.store.autoflush = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._session.store.flush)
+
         self._build_ui()
         self._connect_signals()
         self._install_shortcuts()
@@ -194,6 +205,14 @@ class MainWindow(QMainWindow):
                 lambda idx=ch_idx - 1: self._viewer_panel.toggle_channel_visibility(idx),
             )
 
+    def closeEvent(self, event) -> None:
+        self._save_timer.stop()
+        try:
+            self._session.close()
+        except Exception as exc:
+            print(f"[MainWindow] Could not compact annotations on exit: {exc}")
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # Slot implementations
     # ------------------------------------------------------------------
@@ -212,14 +231,12 @@ class MainWindow(QMainWindow):
         if block_id is None:
             return
 
-        # Persist annotation.
+        # Persist annotation (debounced).
         self._session.store.set_label(block_id, label)
+        self._save_timer.start()
 
         # Update overlay label.
-        class_name = ""
-        if 1 <= label <= len(self._config.classes):
-            class_name = self._config.classes[label - 1]
-        self._viewer_panel.show_label(label, class_name)
+        self._viewer_panel.show_label(label, self._session.class_name(label))
 
         # Refresh block list colour and progress bar.
         self._block_list.refresh_block_status(block_id)
@@ -237,6 +254,7 @@ class MainWindow(QMainWindow):
         if block_id is None:
             return
         self._session.store.clear_label(block_id)
+        self._save_timer.start()
         self._viewer_panel.show_label(None)
         self._block_list.refresh_block_status(block_id)
         annotated_count = len(self._session.store.annotated_block_ids())
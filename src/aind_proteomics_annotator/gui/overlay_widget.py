@@ -5,7 +5,9 @@ The widget is click-through (WA_TransparentForMouseEvents) so it doesn't
 interfere with napari's mouse interactions.
 """
 
-from qtpy.QtCore import Qt
+from functools import lru_cache
+
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtWidgets import QLabel
 
 _DEFAULT_COLOR = "#AAAAAA"
@@ -14,6 +16,14 @@ _DEFAULT_COLOR = "#AAAAAA"
 _OVERLAY_X = 12
 _OVERLAY_Y = 12
 
+# Sentinel for "no style change deferred while hidden" (None is a valid label).
+_NO_PENDING_STYLE = object()
+
+
+@lru_cache(maxsize=64)
+def _format_progress(block_index: int, total: int, unannotated: int) -> str:
+    return f"Block {block_index}/{total}  ·  {unannotated} unannotated"
+
 
 class OverlayWidget(QLabel):
     """Top-left semi-transparent text overlay inside the viewer canvas.
@@ -44,10 +54,27 @@ class OverlayWidget(QLabel):
         self._label_text = "No Label"
         self._progress_text = ""
         self._current_label: "int | None" = None
+        # Line count / widest line (in pixels) of the last laid-out text;
+        # adjustSize() is only needed when the bounding box changes.
+        self._prev_nlines = -1
+        self._prev_width = -1
+
+        # Coalesce bursts of updates (held arrow keys, autoplay) into a single
+        # setText/adjustSize pass per event-loop iteration.
+        self._refresh_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # State deferred while the overlay is hidden; flushed in showEvent.
+        self._pending_text = False
+        self._pending_style_label = _NO_PENDING_STYLE
 
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.move(_OVERLAY_X, _OVERLAY_Y)
+        self.setStyleSheet(_build_stylesheet(self._color_map))
         self._set_style(None)
         self._refresh()
 
@@ -77,7 +104,7 @@ class OverlayWidget(QLabel):
         total       : total number of blocks.
         unannotated : number of blocks not yet annotated.
         """
-        self._progress_text = f"Block {block_index}/{total}  ·  {unannotated} unannotated"
+        self._progress_text = _format_progress(block_index, total, unannotated)
         self._refresh()
 
     def set_admin_info(
@@ -108,26 +135,72 @@ class OverlayWidget(QLabel):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._pending_style_label is not _NO_PENDING_STYLE:
+            label = self._pending_style_label
+            self._pending_style_label = _NO_PENDING_STYLE
+            self._set_style(label)
+        if self._pending_text:
+            self._pending_text = False
+            self._refresh()
+
     def _refresh(self) -> None:
+        """Schedule a text update on the next event-loop iteration."""
+        if not self.isVisible():
+            self._pending_text = True
+            return
+        self._refresh_pending = True
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
+        if not self._refresh_pending:
+            return
+        self._refresh_pending = False
+        if not self.isVisible():
+            self._pending_text = True
+            return
         parts = [self._label_text]
         if self._progress_text:
             parts.append(self._progress_text)
         new_text = "\n".join(parts)
         if new_text != self.text():
             self.setText(new_text)
-            self.adjustSize()
+            nlines = new_text.count("\n")
+            # The font is proportional, so compare rendered widths rather
+            # than character counts.
+            advance = self.fontMetrics().horizontalAdvance
+            width = max(map(advance, new_text.splitlines()), default=0)
+            if (nlines, width) != (self._prev_nlines, self._prev_width):
+                self._prev_nlines, self._prev_width = nlines, width
+                self.adjustSize()
 
     def _set_style(self, label: "int | None") -> None:
-        color = self._color_map.get(label, _DEFAULT_COLOR)
-        self.setStyleSheet(
-            f"""
-            QLabel {{
-                background-color: rgba(0, 0, 0, 170);
-                color: {color};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 5px;
-            }}
-            """
-        )
+        if not self.isVisible():
+            self._pending_style_label = label
+            return
+        # Switch colour via a dynamic property; the stylesheet itself is
+        # parsed once in __init__ and only re-polished here.
+        self.setProperty("labelState", str(label) if label in self._color_map else "none")
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
+
+def _build_stylesheet(color_map: dict) -> str:
+    """Return the overlay QSS with one ``labelState`` selector per label."""
+    rules = [
+        f"""
+        QLabel {{
+            background-color: rgba(0, 0, 0, 170);
+            color: {_DEFAULT_COLOR};
+            font-size: 14px;
+            font-weight: bold;
+            padding: 6px 12px;
+            border-radius: 5px;
+        }}
+        """
+    ]
+    for label, color in color_map.items():
+        rules.append(f'QLabel[labelState="{label}"] {{ color: {color}; }}')
+    return "\n".join(rules)
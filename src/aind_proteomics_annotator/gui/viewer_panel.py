@@ -12,18 +12,30 @@ reparents the widget, so napari renders inside our QMainWindow.
 
 Preloading
 ----------
-After each block is displayed, a background :func:`preload_block_worker`
-is started for the N-1, N+1, and N+2 neighbours (one back, two forward).
-Results are written directly into the shared :class:`BlockCache` so that
-the next navigation request returns immediately on a cache hit.
+As soon as a block load starts, a background :func:`preload_block_worker`
+is started for the N±1 and N±2 neighbours (nearest first), overlapping
+their disk I/O with the user's time on the current block.  Results are
+written directly into the shared :class:`BlockCache` so that the next
+navigation request returns immediately on a cache hit.
+
+Autoplay
+--------
+Autoplay is paced by the vispy canvas rather than a free-running timer:
+each completed draw schedules the next Z step ``autoplay_interval_ms``
+later with ``QTimer.singleShot``.  Slow frames (e.g. while a neighbour
+block is decoding) therefore delay playback instead of queueing up
+backed-up timer ticks.  Steps that produce no redraw (a single-Z block, a
+hidden or minimised canvas) are re-armed directly or by a watchdog timer,
+so playback never stalls while the button shows "Stop".
 """
 
 from __future__ import annotations
 
 import warnings
+from pathlib import Path
 
 import numpy as np
-from qtpy.QtCore import QTimer, Qt, Signal
+from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -35,8 +47,10 @@ from qtpy.QtWidgets import (
 
 from aind_proteomics_annotator.gui.overlay_widget import OverlayWidget
 from aind_proteomics_annotator.models.block_registry import BlockInfo
+from aind_proteomics_annotator.workers.points_loader import load_focus_points_worker
 from aind_proteomics_annotator.workers.tiff_loader import (
     BlockCache,
+    configure_decode_processes,
     load_block_worker,
     preload_block_worker,
 )
@@ -44,6 +58,21 @@ from aind_proteomics_annotator.workers.tiff_loader import (
 # Default colormaps applied to channels 0, 1, 2, 3, …
 _DEFAULT_COLORMAPS = ["gray", "green", "magenta", "cyan", "red", "yellow", "blue"]
 
+# Channels larger than this are shown as a 1×/2×/4× (Y, X) pyramid so napari
+# only uploads the level matching the on-screen resolution.
+_MULTISCALE_MIN_BYTES = 256 * 1024 * 1024
+
+# How long past the autoplay interval to wait for the draw that normally
+# paces the next step before stepping anyway.
+_AUTOPLAY_DRAW_TIMEOUT_MS = 250
+
+
+def _display_data(arr: np.ndarray):
+    """Return *arr*, or a stride-view YX pyramid list for very large channels."""
+    if arr.nbytes > _MULTISCALE_MIN_BYTES and arr.ndim >= 2:
+        return [arr, arr[..., ::2, ::2], arr[..., ::4, ::4]]
+    return arr
+
 
 class ViewerPanel(QWidget):
     """Embeds a napari Viewer and manages block loading and display.
@@ -68,18 +97,36 @@ class ViewerPanel(QWidget):
         self._config = config
         self._registry = registry
         self._current_block_id: str | None = None
-        self._block_cache = BlockCache(max_size=config.max_cached_blocks)
+        self._block_cache = BlockCache(
+            max_size=config.max_cached_blocks, max_bytes=config.max_cache_bytes
+        )
+        configure_decode_processes(config.decode_processes)
         self._preload_worker = None  # track running preload worker
 
-        self._autoplay_timer = QTimer(self)
-        self._autoplay_timer.setInterval(config.autoplay_interval_ms)
+        self._autoplay_interval_ms = config.autoplay_interval_ms
+        self._autoplay_active = False
+        # True while a singleShot advance is queued, so redraws triggered by
+        # anything else (panning, contrast changes) don't stack extra steps.
+        self._autoplay_pending = False
+        # Fallback tick for steps whose draw never arrives.
+        self._autoplay_watchdog = QTimer(self)
+        self._autoplay_watchdog.setSingleShot(True)
+        self._autoplay_watchdog.timeout.connect(self._autoplay_step)
+        self._interval_fmt_cache: dict[int, str] = {}
 
         self._viewer = None
         self._qt_viewer_widget = None
         self._overlay: OverlayWidget | None = None
-        self._focus_points: dict[str, np.ndarray] = {}  # parent_path -> (N,3) array
+        self._focus_points: dict[str, np.ndarray] = {}  # parent_path -> (N,3) memmap
+        self._focus_points_worker = None
         self._focus_layer = None
+        self._channel_layers: dict = {}  # channel index -> napari Image layer
         self._show_focus_points = True
+        # Dims accessors and Z extent of the displayed block, bound once per
+        # load so the autoplay tick avoids evented-model attribute lookups.
+        self._set_step = None
+        self._get_step = None
+        self._z_max = 0
 
         self._build_ui()
         self._connect_internal()
@@ -101,14 +148,22 @@ class ViewerPanel(QWidget):
         # Bind 'r' through napari's key system so reset_view works when the
         # vispy canvas has focus (Qt ApplicationShortcut doesn't reach it).
         # overwrite=True is required; napari already owns 'r' for roll-dims.
-        self._viewer.bind_key("r", lambda _: self._viewer.reset_view(), overwrite=True)
+        self._viewer.bind_key("r", lambda _: self.reset_view(), overwrite=True)
 
+        # napari flags private-widget access as deprecated; silence only
+        # that, and only around the accesses below.
         with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+            warnings.simplefilter("ignore", DeprecationWarning)
             self._qt_viewer_widget = self._viewer.window._qt_viewer
+            # Newer napari wraps the vispy SceneCanvas; older versions
+            # expose it directly as qt_viewer.canvas.
+            canvas = self._qt_viewer_widget.canvas
+            canvas = getattr(canvas, "_scene_canvas", canvas)
 
         layout.addWidget(self._qt_viewer_widget, stretch=1)
 
+        canvas.events.draw.connect(self._on_canvas_drawn)
+
         # Overlay uses class colors from config
         self._overlay = OverlayWidget(
             parent=self._qt_viewer_widget,
@@ -131,7 +186,7 @@ class ViewerPanel(QWidget):
         ctrl_layout.addWidget(self._autoplay_btn)
 
         self._interval_label = QLabel(
-            f"({self._config.autoplay_interval_ms / 1000:.1f}s/frame)"
+            self._interval_text(self._config.autoplay_interval_ms)
         )
         ctrl_layout.addWidget(self._interval_label)
 
@@ -165,7 +220,6 @@ class ViewerPanel(QWidget):
 
     def _connect_internal(self) -> None:
         self._autoplay_btn.toggled.connect(self._toggle_autoplay)
-        self._autoplay_timer.timeout.connect(self._advance_z_slice)
         self._slower_btn.clicked.connect(self._play_slower)
         self._faster_btn.clicked.connect(self._play_faster)
         self._focus_cb.toggled.connect(self._toggle_focus_points)
@@ -193,11 +247,15 @@ class ViewerPanel(QWidget):
             block_info.tiff_files,
             block_info.block_id,
             self._block_cache,
+            quantize=self._config.quantize_display,
         )
         worker.returned.connect(self._on_block_loaded)
         worker.errored.connect(self._on_load_error)
         worker.start()
 
+        # Warm the cache for the neighbours while the user looks at this one.
+        self._trigger_preload(block_info.block_id)
+
     def show_label(self, label: "int | None", label_name: str = "") -> None:
         """Update the top-left overlay. Pass label=None to clear."""
         if self._overlay:
@@ -223,7 +281,7 @@ class ViewerPanel(QWidget):
             self._overlay.set_admin_info(label, consensus, agreement)
 
     def toggle_autoplay(self) -> None:
-        """Toggle the autoplay timer on/off (Space shortcut)."""
+        """Toggle autoplay on/off (Space shortcut)."""
         self._autoplay_btn.setChecked(not self._autoplay_btn.isChecked())
 
     def reset_view(self) -> None:
@@ -233,20 +291,19 @@ class ViewerPanel(QWidget):
 
     def toggle_channel_visibility(self, channel_index: int) -> None:
         """Toggle visibility of the channel layer at *channel_index* (Alt+N)."""
-        name = self._config.get_channel_name(channel_index)
-        if self._viewer is None:
-            return
-        try:
-            layer = self._viewer.layers[name]
+        layer = self._channel_layers.get(channel_index)
+        if layer is not None:
             layer.visible = not layer.visible
-        except KeyError:
-            pass
 
     def set_autoplay_interval(self, ms: int) -> None:
-        self._autoplay_timer.setInterval(ms)
+        self._autoplay_interval_ms = ms
 
     def reload_local_points(self) -> None:
-        """Reload local_points.npy after the data root changes."""
+        """Reload local_points.npy after the data root changes.
+
+        The focus point for the current block is refreshed once the
+        background load completes.
+        """
         self._load_focus_points()
         if self._current_block_id:
             self._update_focus_point_layer(self._current_block_id)
@@ -266,41 +323,69 @@ class ViewerPanel(QWidget):
 
     def _display_block(self, block_id: str, arrays: list) -> None:
         """Replace napari layers with the loaded channel arrays."""
+        # napari slices Z planes straight out of these during scrubbing and
+        # autoplay, so each channel must be C-contiguous.  _load_channels
+        # already returns per-channel views of one stacked (C, Z, Y, X)
+        # buffer (or memmaps), which pass through here without a copy.
+        # With quantize_display the workers already converted float channels
+        # to uint8 before caching; pin those layers to the full uint8 range.
+        arrays = [np.ascontiguousarray(a) for a in arrays]
+        data = [_display_data(a) for a in arrays]
+        limits = [
+            (0, 255) if self._config.quantize_display and a.dtype == np.uint8 else None
+            for a in arrays
+        ]
         channel_layers = [
             l for l in list(self._viewer.layers) if not l.name.startswith("Focus")
         ]
         channel_names: list[str] = []
 
-        if len(channel_layers) == len(arrays):
+        if len(channel_layers) == len(data) and all(
+            layer.multiscale == isinstance(d, list)
+            for layer, d in zip(channel_layers, data)
+        ):
             # Fast path: update layer data in-place to avoid full reconstruction.
-            for layer, arr in zip(channel_layers, arrays):
-                layer.data = arr
+            for i, (layer, d, lim) in enumerate(zip(channel_layers, data, limits)):
+                layer.data = d
+                if lim is not None:
+                    # Don't carry over the previous block's limits.
+                    layer.contrast_limits_range = lim
+                    layer.contrast_limits = lim
                 channel_names.append(layer.name)
-            # Remove the stale focus point layer; _update_focus_point_layer re-adds it.
-            if self._focus_layer is not None:
-                try:
-                    self._viewer.layers.remove(self._focus_layer)
-                except Exception:
-                    pass
-                self._focus_layer = None
+                self._channel_layers[i] = layer
+            # The focus point layer is kept; _update_focus_point_layer moves it.
         else:
-            # Slow path: channel count changed — rebuild all layers from scratch.
+            # Slow path: channel count or multiscale-ness changed — rebuild
+            # all layers from scratch.
+            from napari.layers import Image
+
             self._viewer.layers.clear()
             self._focus_layer = None
-            for i, arr in enumerate(arrays):
-                name = self._config.get_channel_name(i)
-                cmap = _DEFAULT_COLORMAPS[i % len(_DEFAULT_COLORMAPS)]
-                self._viewer.add_image(
-                    arr,
+            channel_names = [self._config.get_channel_name(i) for i in range(len(arrays))]
+            cmaps = [_DEFAULT_COLORMAPS[i % len(_DEFAULT_COLORMAPS)] for i in range(len(arrays))]
+            new_layers = [
+                Image(
+                    d,
                     name=name,
                     colormap=cmap,
                     blending="additive",
+                    multiscale=isinstance(d, list),
+                    contrast_limits=lim,
                 )
-                channel_names.append(name)
+                for d, name, cmap, lim in zip(data, channel_names, cmaps, limits)
+            ]
+            # One extend() instead of N add_image() calls.
+            self._viewer.layers.extend(new_layers)
+            self._channel_layers = dict(enumerate(new_layers))
 
         self._viewer.dims.ndisplay = 2
         self._viewer.reset_view()
 
+        dims = self._viewer.dims
+        self._z_max = int(dims.range[0][1]) if dims.ndim >= 1 else 0
+        self._set_step = dims.set_current_step
+        self._get_step = lambda: dims.current_step[0]
+
         self._update_focus_point_layer(block_id)
 
         self.channels_loaded.emit(channel_names)
@@ -308,84 +393,124 @@ class ViewerPanel(QWidget):
         # Restore any existing annotation overlay.
         label = self._session.store.get_label(block_id)
         if label is not None:
-            class_name = ""
-            if 1 <= label <= len(self._config.classes):
-                class_name = self._config.classes[label - 1]
-            self._overlay.set_label(label, class_name)
+            self._overlay.set_label(label, self._session.class_name(label))
         else:
             self._overlay.clear()
 
-        # Kick off background preload of neighbour blocks.
-        self._trigger_preload(block_id)
-
     # ------------------------------------------------------------------
     # Preloading
     # ------------------------------------------------------------------
 
     def _trigger_preload(self, current_block_id: str) -> None:
-        """Start a background worker to pre-warm the cache for N-1, N+1..N+3."""
+        """Start a background worker to pre-warm the cache for N±1 and N±2."""
         if self._registry is None:
             return
-        all_blocks = self._registry.all_blocks()
-        try:
-            idx = next(
-                i for i, b in enumerate(all_blocks) if b.block_id == current_block_id
-            )
-        except StopIteration:
-            return
-
-        neighbors = []
-        for offset in (-1, 1, 2, 3):
-            ni = idx + offset
-            if 0 <= ni < len(all_blocks):
-                neighbors.append(all_blocks[ni])
-
+        cache = self._block_cache
+        # Skip cached blocks and ones a previous preload is still decoding.
+        neighbors = [
+            b
+            for b in self._registry.neighbors(current_block_id, radius=2)
+            if b.block_id not in cache and not cache.is_loading(b.block_id)
+        ]
         if not neighbors:
             return
 
-        worker = preload_block_worker(neighbors, self._block_cache)
+        # Stop the previous preload between blocks so workers don't pile up
+        # and compete with the foreground load under rapid navigation.
+        if self._preload_worker is not None and self._preload_worker.is_running:
+            self._preload_worker.quit()
+
+        worker = preload_block_worker(
+            neighbors, self._block_cache, quantize=self._config.quantize_display
+        )
         worker.errored.connect(
             lambda exc: print(f"[Preload] Error: {exc}")
         )
+        worker.finished.connect(lambda w=worker: self._on_preload_finished(w))
         worker.start()
         self._preload_worker = worker
 
+    def _on_preload_finished(self, worker) -> None:
+        # Drop our reference so finished workers aren't kept alive.
+        if self._preload_worker is worker:
+            self._preload_worker = None
+
     # ------------------------------------------------------------------
     # Autoplay
     # ------------------------------------------------------------------
 
     def _play_slower(self) -> None:
         """Increase the autoplay interval by 100 ms (play slower), max 10 s."""
-        new_ms = min(10_000, self._autoplay_timer.interval() + 100)
-        self._autoplay_timer.setInterval(new_ms)
-        self._interval_label.setText(f"({new_ms / 1000:.1f}s/frame)")
+        new_ms = min(10_000, self._autoplay_interval_ms + 100)
+        self._autoplay_interval_ms = new_ms
+        self._interval_label.setText(self._interval_text(new_ms))
 
     def _play_faster(self) -> None:
         """Decrease the autoplay interval by 100 ms (play faster), min 50 ms."""
-        new_ms = max(50, self._autoplay_timer.interval() - 100)
-        self._autoplay_timer.setInterval(new_ms)
-        self._interval_label.setText(f"({new_ms / 1000:.1f}s/frame)")
+        new_ms = max(50, self._autoplay_interval_ms - 100)
+        self._autoplay_interval_ms = new_ms
+        self._interval_label.setText(self._interval_text(new_ms))
+
+    def _interval_text(self, ms: int) -> str:
+        """Return the cached "(N.Ns/frame)" label for an interval in ms."""
+        text = self._interval_fmt_cache.get(ms)
+        if text is None:
+            text = f"({ms / 1000:.1f}s/frame)"
+            self._interval_fmt_cache[ms] = text
+        return text
 
     def _toggle_autoplay(self, checked: bool) -> None:
+        self._autoplay_active = checked
         if checked:
             self._autoplay_btn.setText("Stop")
-            self._autoplay_timer.start()
+            # Kick off the first step; later ones are scheduled per draw.
+            self._schedule_autoplay_step()
         else:
             self._autoplay_btn.setText("Start")
-            self._autoplay_timer.stop()
+            self._autoplay_watchdog.stop()
+
+    def _on_canvas_drawn(self, _event=None) -> None:
+        """Schedule the next autoplay step once the canvas finished a frame."""
+        if self._autoplay_active:
+            self._autoplay_watchdog.stop()
+            self._schedule_autoplay_step()
 
-    def _advance_z_slice(self) -> None:
-        """Advance the current Z slice by one step, wrapping at the end."""
-        if self._viewer is None or not self._viewer.layers:
+    def _schedule_autoplay_step(self) -> None:
+        if self._autoplay_pending:
             return
-        dims = self._viewer.dims
-        if dims.ndim < 1:
+        self._autoplay_pending = True
+        QTimer.singleShot(self._autoplay_interval_ms, self._autoplay_step)
+
+    def _autoplay_step(self) -> None:
+        self._autoplay_pending = False
+        if not self._autoplay_active:
             return
-        current = dims.current_step[0]
-        z_range = dims.range[0]
-        max_z = int(z_range[1])
-        next_z = (current + 1) % max_z if max_z > 0 else 0
-        dims.set_current_step(0, next_z)
+        if self._advance_z_slice():
+            # The resulting draw schedules the next step; the watchdog
+            # covers a hidden or minimised canvas that never draws.
+            self._autoplay_watchdog.start(
+                self._autoplay_interval_ms + _AUTOPLAY_DRAW_TIMEOUT_MS
+            )
+        else:
+            # Nothing changed (no block yet, single Z slice): no draw will
+            # follow, so re-arm directly.
+            self._schedule_autoplay_step()
+
+    def _advance_z_slice(self) -> bool:
+        """Advance the current Z slice by one step, wrapping at the end.
+
+        Returns True if the displayed slice changed.
+        """
+        set_step = self._set_step
+        if set_step is None:
+            return False
+        z_max = self._z_max
+        current = self._get_step()
+        target = (current + 1) % z_max if z_max > 0 else 0
+        if target == current:
+            return False
+        set_step(0, target)
+        return True
 
     # ------------------------------------------------------------------
     # Focus point overlay
@@ -402,6 +527,11 @@ class ViewerPanel(QWidget):
         self._viewer.dims.ndisplay = 3 if checked else 2
 
     def _load_focus_points(self) -> None:
+        """Start a background load of local_points.npy for all block folders.
+
+        Focus points stay empty (so _update_focus_point_layer is a no-op)
+        until :meth:`_on_focus_points_loaded` receives the result.
+        """
         self._focus_points = {}
         if self._registry is None:
             self._set_focus_toggle_enabled(False, "No registry")
@@ -415,25 +545,26 @@ class ViewerPanel(QWidget):
         # Also check data_root itself (for direct blocks folder case)
         parent_folders.add(self._registry.data_root)
 
-        any_loaded = False
-        for folder in parent_folders:
-            npy_path = folder / "local_points.npy"
-            if not npy_path.exists():
-                continue
-            try:
-                points = np.load(npy_path)
-                if points.ndim != 2 or points.shape[1] != 3:
-                    print(
-                        f"[ViewerPanel] Skipping {npy_path}: "
-                        f"expected shape (N, 3), got {points.shape}"
-                    )
-                    continue
-                self._focus_points[str(folder.resolve())] = points.astype(float, copy=False)
-                any_loaded = True
-            except Exception as exc:
-                print(f"[ViewerPanel] Could not load {npy_path}: {exc}")
+        self._set_focus_toggle_enabled(False, "Loading local_points.npy…")
+        worker = load_focus_points_worker(list(parent_folders))
+        worker.returned.connect(
+            lambda points, w=worker: self._on_focus_points_loaded(w, points)
+        )
+        worker.errored.connect(
+            lambda exc: print(f"[ViewerPanel] Could not load focus points: {exc}")
+        )
+        self._focus_points_worker = worker
+        worker.start()
 
+    def _on_focus_points_loaded(self, worker, points: dict) -> None:
+        if worker is not self._focus_points_worker:
+            return  # superseded by a later reload
+        self._focus_points_worker = None
+        self._focus_points = points
+        any_loaded = bool(points)
         self._set_focus_toggle_enabled(any_loaded, "" if any_loaded else "local_points.npy not found")
+        if self._current_block_id:
+            self._update_focus_point_layer(self._current_block_id)
 
     def _set_focus_toggle_enabled(self, enabled: bool, reason: str) -> None:
         if not hasattr(self, "_focus_cb"):
@@ -446,22 +577,22 @@ class ViewerPanel(QWidget):
 
     def _update_focus_point_layer(self, block_id: str) -> None:
         if self._viewer is None or self._registry is None:
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
         if not self._focus_points:
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
 
         block = self._registry.get_block(block_id)
         if block is None:
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
 
         # Find local_points.npy for this block's parent folder
         parent_key = str(block.path.parent.resolve())
         points_array = self._focus_points.get(parent_key)
         if points_array is None:
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
 
         # Find the block's index within its parent folder (sorted order)
@@ -472,25 +603,39 @@ class ViewerPanel(QWidget):
         try:
             idx = next(i for i, b in enumerate(sibling_blocks) if b.block_id == block_id)
         except StopIteration:
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
 
         if idx >= len(points_array):
-            self._focus_layer = None
+            self._remove_focus_layer()
             return
 
-        point = points_array[idx]
-        layer = self._viewer.add_points(
-            [point],
-            name="Focus Point",
-            size=10,
-            symbol="x",
-            face_color="#FFFF00",
-            opacity=1.0,
-        )
-        layer.visible = self._show_focus_points
-        self._focus_layer = layer
-        self._center_on_focus_point(point)
+        # Reuse a single Points layer rather than adding a new one on every
+        # navigation.  Each update assigns a fresh (1, 3) array so the layer
+        # never aliases a buffer we mutate behind its back.
+        point = np.array(points_array[idx], dtype=np.float64).reshape(1, 3)
+        if self._focus_layer is None:
+            self._focus_layer = self._viewer.add_points(
+                point,
+                name="Focus Point",
+                size=10,
+                symbol="x",
+                face_color="#FFFF00",
+                opacity=1.0,
+            )
+        else:
+            self._focus_layer.data = point
+        self._focus_layer.visible = self._show_focus_points
+        self._center_on_focus_point(point[0])
+
+    def _remove_focus_layer(self) -> None:
+        if self._focus_layer is None:
+            return
+        try:
+            self._viewer.layers.remove(self._focus_layer)
+        except Exception:
+            pass
+        self._focus_layer = None
 
     def _center_on_focus_point(self, point: np.ndarray) -> None:
         if self._viewer is None:
@@ -503,7 +648,7 @@ class ViewerPanel(QWidget):
         dims = self._viewer.dims
         # Start the Z-slice at 0 so the user sees the volume from the beginning,
         # not jumping into the middle of the stack at the focus Z position.
-        if dims.ndim >= 1:
+        if dims.ndim >= 1 and dims.current_step[0] != 0:
             dims.set_current_step(0, 0)
 
         try:
@@ -13,6 +13,19 @@ Per-user schema (annotations/users/{username}.json):
       }
     }
 
+Label changes are not written to the snapshot above on every click.  They
+are appended as single records to a sibling journal
+(annotations/users/{username}.jsonl):
+
+    {"op": "set", "parent_path": "...", "block_name": "block_0000",
+     "label": 1, "ts": "<ISO-8601>"}
+    {"op": "clear", "parent_path": "...", "block_name": "block_0000",
+     "ts": "<ISO-8601>"}
+
+Readers replay the journal over the snapshot (see
+:func:`load_annotation_file`); :meth:`AnnotationStore.compact` folds it
+back into the snapshot and removes it.
+
 Admin schema (annotations/admin/final_labels.json):
     {
       "updated_at": "<ISO-8601>",
@@ -28,34 +41,240 @@ Admin schema (annotations/admin/final_labels.json):
     }
 """
 
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
-
-from aind_proteomics_annotator.utils.atomic_io import atomic_write_json, read_json
+from types import MappingProxyType
+from typing import Mapping, Optional, TYPE_CHECKING
+
+from aind_proteomics_annotator.utils.atomic_io import (
+    JsonWriter,
+    append_jsonl,
+    atomic_write_json,
+    batched_writes,
+    read_json,
+    read_jsonl,
+)
+
+try:
+    import simdjson
+except ImportError:  # optional speedup for the admin panel
+    simdjson = None
 
 if TYPE_CHECKING:
     from aind_proteomics_annotator.models.block_registry import BlockRegistry
 
+# Journal length above which the store folds it back into the JSON snapshot.
+_COMPACT_THRESHOLD = 500
+# ...or journal age: a non-empty journal older than this (seconds) is also
+# compacted on the next flush, bounding replay work for other readers
+# (e.g. the admin panel) during long sessions.
+_COMPACT_INTERVAL_S = 300.0
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=8192)
+def _split_block_id(
+    block_id: str, registry: Optional["BlockRegistry"], generation: int
+) -> tuple[str, str]:
+    """Memoized (parent_path, block_name) split of *block_id*.
+
+    *generation* is the registry's scan counter; it is part of the cache key
+    so a rescan (e.g. a new data root) never serves stale parent paths.
+    """
+    if registry is not None:
+        absolute_parent = registry.get_absolute_parent_path(block_id)
+        # Extract block name from block_id
+        block_name = block_id.split("/")[-1] if "/" in block_id else block_id
+        return absolute_parent, block_name
+    # Fallback: parse block_id as relative path
+    if "/" in block_id:
+        parts = block_id.rsplit("/", 1)
+        return parts[0], parts[1]
+    return "", block_id
+
+
+def _flat_key(parent_path: str, block_name: str) -> str:
+    """Reconstruct the flat block_id used by the in-memory index."""
+    return f"{parent_path}/{block_name}" if parent_path else block_name
+
+
+def _flatten(nested: dict) -> dict:
+    """Flatten ``{parent_path: {block_name: entry}}`` into ``{block_id: entry}``."""
+    return {
+        _flat_key(parent_path, block_name): entry
+        for parent_path, blocks in nested.items()
+        for block_name, entry in blocks.items()
+    }
+
+
+def _snapshot(data: dict, key: str) -> dict:
+    """Copy *data* deeply enough to hand to a background writer.
+
+    Entries are always replaced rather than mutated, so copying the
+    top-level and per-parent dicts is sufficient.
+    """
+    copy = dict(data)
+    copy[key] = {parent: dict(blocks) for parent, blocks in data.get(key, {}).items()}
+    return copy
+
+
+def journal_path(filepath: Path) -> Path:
+    """Return the JSON-lines journal path paired with a user's snapshot file."""
+    return Path(filepath).with_suffix(".jsonl")
+
+
+def _apply_journal(data: dict, records: list) -> None:
+    """Replay journal *records* in order onto snapshot *data* in place."""
+    annotations = data.setdefault("annotations", {})
+    for rec in records:
+        parent_path = rec.get("parent_path", "")
+        block_name = rec.get("block_name")
+        if block_name is None:
+            continue
+        if rec.get("op") == "set":
+            annotations.setdefault(parent_path, {})[block_name] = {
+                "label": rec.get("label"),
+                "annotated_at": rec.get("ts"),
+            }
+        elif rec.get("op") == "clear":
+            blocks = annotations.get(parent_path)
+            if blocks is not None:
+                blocks.pop(block_name, None)
+                if not blocks:
+                    del annotations[parent_path]
+        if rec.get("ts"):
+            data["updated_at"] = rec["ts"]
+
+
+def storage_key(block_id: str, registry: Optional["BlockRegistry"] = None) -> str:
+    """Return the flat key *block_id*'s annotations are stored under."""
+    generation = registry.generation if registry is not None else 0
+    return _flat_key(*_split_block_id(block_id, registry, generation))
+
+
+def rekey_by_block_id(keyed: Mapping, block_by_key: Mapping) -> dict:
+    """Re-key a ``{storage_key: value}`` mapping by block id.
+
+    *block_by_key* maps :func:`storage_key` values to block ids; build it
+    once per registry scan.  Entries for blocks not in it are dropped.
+    """
+    return {block_by_key[key]: value for key, value in keyed.items() if key in block_by_key}
+
+
+# simdjson parsers are reusable but not thread-safe.
+_simdjson_parser = simdjson.Parser() if simdjson is not None else None
+_simdjson_lock = threading.Lock()
+
+
+def _extract_labels(doc) -> Optional[dict]:
+    """Copy ``{flat_key: label}`` out of a parsed snapshot (DOM or dict)."""
+    if not hasattr(doc, "get"):
+        return None
+    annotations = doc.get("annotations")
+    if annotations is None:
+        return None
+    return {
+        _flat_key(parent_path, block_name): entry.get("label")
+        for parent_path, blocks in annotations.items()
+        for block_name, entry in blocks.items()
+    }
+
+
+def _parse_labels(raw: bytes) -> Optional[dict]:
+    """Parse only the labels out of snapshot bytes with simdjson.
+
+    The lazy DOM is walked once and every value is materialised as a
+    Python str/int, so no simdjson object outlives the call (the parser
+    refuses to be reused while any are alive).
+    """
+    with _simdjson_lock:
+        return _extract_labels(_simdjson_parser.parse(raw))
+
+
+def load_annotation_labels(filepath: Path) -> Optional[dict]:
+    """Read only ``{flat_key: label}`` from a user's snapshot and journal.
+
+    Cheaper than :func:`load_annotation_file` for consensus building: no
+    per-entry dicts are kept and, when pysimdjson is installed, timestamps
+    and other fields are never materialised.  Returns None if *filepath*
+    is not an annotation file and has no journal.
+    """
+    if _simdjson_parser is not None:
+        labels = read_json(filepath, parse=_parse_labels)
+    else:
+        labels = _extract_labels(read_json(filepath))
+    records = read_jsonl(journal_path(filepath))
+    if labels is None and not records:
+        return None
+    if labels is None:
+        labels = {}
+    for rec in records:
+        block_name = rec.get("block_name")
+        if block_name is None:
+            continue
+        key = _flat_key(rec.get("parent_path", ""), block_name)
+        if rec.get("op") == "set":
+            labels[key] = rec.get("label")
+        elif rec.get("op") == "clear":
+            labels.pop(key, None)
+    return labels
+
+
+def load_annotation_file(filepath: Path) -> Optional[dict]:
+    """Read a user's annotation snapshot with its journal replayed on top.
+
+    Returns None if neither the snapshot nor the journal exists.
+    """
+    data = read_json(filepath)
+    records = read_jsonl(journal_path(filepath))
+    if data is None and not records:
+        return None
+    if data is None:
+        data = {"annotations": {}}
+    _apply_journal(data, records)
+    return data
+
+
 class AnnotationStore:
     """Manages a single user's annotation JSON file.
 
-    All writes are atomic via atomic_write_json, making this safe for
-    shared filesystem access from multiple machines.
+    Label changes are appended to a JSON-lines journal (O(1) bytes per
+    click); the full snapshot is rewritten atomically via atomic_write_json
+    only by :meth:`compact`, keeping it safe for shared filesystem access
+    from multiple machines.
+
+    If a :class:`JsonWriter` is given, disk writes are queued to its
+    background thread instead of blocking the caller.
     """
 
     def __init__(
-        self, filepath: Path, username: str, registry: Optional["BlockRegistry"] = None
+        self,
+        filepath: Path,
+        username: str,
+        registry: Optional["BlockRegistry"] = None,
+        writer: Optional[JsonWriter] = None,
     ) -> None:
         self._filepath = Path(filepath)
+        self._journal_path = journal_path(self._filepath)
         self._username = username
         self._registry = registry
+        self._writer = writer
         self._data: dict = {}
+        self._pending: list[dict] = []  # journal records not yet on disk
+        self._journal_len = 0
+        self._last_compact = time.monotonic()
+        # When False, set/clear only queue journal records and the owner is
+        # responsible for calling flush() (e.g. from a debounce timer).
+        self.autoflush = True
+        # Flat {block_id: entry} index mirroring self._data["annotations"];
+        # entries are shared with the nested dict, which remains the on-disk layout.
+        self._flat: dict[str, dict] = {}
 
     def _get_storage_key(self, block_id: str) -> tuple[str, str]:
         """Return (absolute_parent_path, block_name) for storage.
@@ -64,98 +283,150 @@ class AnnotationStore:
         Otherwise falls back to parsing the block_id.
         """
         if self._registry:
-            absolute_parent = self._registry.get_absolute_parent_path(block_id)
-            # Extract block name from block_id
-            block_name = block_id.split("/")[-1] if "/" in block_id else block_id
-            return absolute_parent, block_name
-        else:
-            # Fallback: parse block_id as relative path
-            if "/" in block_id:
-                parts = block_id.rsplit("/", 1)
-                return parts[0], parts[1]
-            return "", block_id
+            return _split_block_id(block_id, self._registry, self._registry.generation)
+        return _split_block_id(block_id, None, 0)
 
     def load_or_create(self) -> None:
-        """Load existing annotation file or create a fresh one."""
+        """Load existing annotation file (replaying its journal) or create one.
+
+        The journal is compacted into the snapshot when it has grown past
+        the compaction threshold, or when no snapshot exists yet.
+        """
         raw = read_json(self._filepath)
+        records = read_jsonl(self._journal_path)
         if raw is None:
-            self._data = {
+            now = _now_iso()
+            raw = {
                 "username": self._username,
-                "created_at": _now_iso(),
-                "updated_at": _now_iso(),
+                "created_at": now,
+                "updated_at": now,
                 "annotations": {},
             }
-            self._save()
+            needs_snapshot = True
         else:
-            self._data = raw
+            needs_snapshot = False
+        _apply_journal(raw, records)
+        self._data = raw
+        self._flat = _flatten(self._data.get("annotations", {}))
+        self._pending = []
+        self._journal_len = len(records)
+        if needs_snapshot or self._journal_len > _COMPACT_THRESHOLD:
+            self.compact()
 
     def get_label(self, block_id: str) -> Optional[int]:
         """Return the label for *block_id*, or None if not yet annotated."""
-        parent_path, block_name = self._get_storage_key(block_id)
-        return (
-            self._data.get("annotations", {})
-            .get(parent_path, {})
-            .get(block_name, {})
-            .get("label")
-        )
+        entry = self._flat.get(_flat_key(*self._get_storage_key(block_id)))
+        return entry.get("label") if entry is not None else None
 
     def set_label(self, block_id: str, label: int) -> None:
-        """Set the label for *block_id* and immediately persist to disk."""
+        """Set the label for *block_id* and persist (immediately if autoflush)."""
         parent_path, block_name = self._get_storage_key(block_id)
         if "annotations" not in self._data:
             self._data["annotations"] = {}
         if parent_path not in self._data["annotations"]:
             self._data["annotations"][parent_path] = {}
-        self._data["annotations"][parent_path][block_name] = {
+        ts = _now_iso()
+        entry = {
             "label": label,
-            "annotated_at": _now_iso(),
+            "annotated_at": ts,
         }
-        self._data["updated_at"] = _now_iso()
-        self._save()
+        self._data["annotations"][parent_path][block_name] = entry
+        self._flat[_flat_key(parent_path, block_name)] = entry
+        self._data["updated_at"] = ts
+        self._pending.append(
+            {
+                "op": "set",
+                "parent_path": parent_path,
+                "block_name": block_name,
+                "label": label,
+                "ts": ts,
+            }
+        )
+        if self.autoflush:
+            self.flush()
 
-    def all_annotations(self) -> dict:
-        """Return a copy of all {block_id: {"label": int, ...}} entries.
+    def all_annotations(self) -> Mapping:
+        """Return a read-only view of all {block_id: {"label": int, ...}} entries.
 
-        Flattens the nested structure back into a flat dictionary.
+        The view is live and must not be mutated through its entry dicts;
+        callers that need a snapshot should take ``dict(...)`` of it.
         """
-        result = {}
-        annotations = self._data.get("annotations", {})
-        for parent_path, blocks in annotations.items():
-            for block_name, data in blocks.items():
-                # Reconstruct block_id from parent_path and block_name
-                if parent_path:
-                    block_id = f"{parent_path}/{block_name}"
-                else:
-                    block_id = block_name
-                result[block_id] = data
-        return result
+        return MappingProxyType(self._flat)
 
     def annotated_block_ids(self) -> set:
         """Return the set of block IDs that have been annotated."""
-        result = set()
-        annotations = self._data.get("annotations", {})
-        for parent_path, blocks in annotations.items():
-            for block_name in blocks.keys():
-                if parent_path:
-                    result.add(f"{parent_path}/{block_name}")
-                else:
-                    result.add(block_name)
-        return result
+        return set(self._flat)
 
     def clear_label(self, block_id: str) -> None:
-        """Remove the annotation for *block_id* and persist. No-op if absent."""
+        """Remove the annotation for *block_id* and persist. No-op if absent.
+
+        Persists immediately if autoflush, otherwise on the next flush().
+        """
         parent_path, block_name = self._get_storage_key(block_id)
         annotations = self._data.get("annotations", {})
         if parent_path in annotations and block_name in annotations[parent_path]:
             del annotations[parent_path][block_name]
+            self._flat.pop(_flat_key(parent_path, block_name), None)
             # Clean up empty parent path dictionaries
             if not annotations[parent_path]:
                 del annotations[parent_path]
-            self._data["updated_at"] = _now_iso()
-            self._save()
-
-    def _save(self) -> None:
-        atomic_write_json(self._filepath, self._data)
+            ts = _now_iso()
+            self._data["updated_at"] = ts
+            self._pending.append(
+                {
+                    "op": "clear",
+                    "parent_path": parent_path,
+                    "block_name": block_name,
+                    "ts": ts,
+                }
+            )
+            if self.autoflush:
+                self.flush()
+
+    def compact(self) -> None:
+        """Write the full snapshot atomically and discard the journal.
+
+        A crash between the two steps is harmless: replaying the old
+        journal over the new snapshot yields the same state.
+        """
+        if self._writer is not None:
+            self._writer.write_json(
+                self._filepath,
+                _snapshot(self._data, "annotations"),
+                then_unlink=self._journal_path,
+            )
+        else:
+            # Make the rename durable before the journal disappears.
+            with batched_writes(self._filepath.parent):
+                atomic_write_json(self._filepath, self._data, durability="batched")
+            try:
+                self._journal_path.unlink()
+            except FileNotFoundError:
+                pass
+        self._pending = []
+        self._journal_len = 0
+        self._last_compact = time.monotonic()
+
+    def flush(self, wait: bool = False) -> None:
+        """Append pending journal records to disk.
+
+        With a background writer, *wait* blocks until the records (and any
+        earlier queued writes) are on disk.
+        """
+        if self._pending:
+            records, self._pending = self._pending, []
+            if self._writer is not None:
+                self._writer.append_jsonl(self._journal_path, records)
+            else:
+                append_jsonl(self._journal_path, records)
+            self._journal_len += len(records)
+            if (
+                self._journal_len > _COMPACT_THRESHOLD
+                or time.monotonic() - self._last_compact > _COMPACT_INTERVAL_S
+            ):
+                self.compact()
+        if wait and self._writer is not None:
+            self._writer.wait()
 
 
 class FinalLabelStore:
@@ -166,17 +437,26 @@ class FinalLabelStore:
     """
 
     def __init__(
-        self, filepath: Path, registry: Optional["BlockRegistry"] = None
+        self,
+        filepath: Path,
+        registry: Optional["BlockRegistry"] = None,
+        writer: Optional[JsonWriter] = None,
     ) -> None:
         self._filepath = Path(filepath)
         self._registry = registry
+        self._writer = writer
         self._data: dict = {"updated_at": _now_iso(), "labels": {}}
+        # Flat {storage_key: entry} index mirroring self._data["labels"].
+        self._flat_labels: dict[str, dict] = {}
 
     def load(self) -> None:
         """Load existing final labels file if it exists."""
+        if self._writer is not None:
+            self._writer.wait()  # don't read back a file with a write in flight
         raw = read_json(self._filepath)
         if raw:
             self._data = raw
+            self._flat_labels = _flatten(self._data.get("labels", {}))
 
     def _get_storage_key(self, block_id: str) -> tuple[str, str]:
         """Return (absolute_parent_path, block_name) for storage.
@@ -185,16 +465,8 @@ class FinalLabelStore:
         Otherwise falls back to parsing the block_id.
         """
         if self._registry:
-            absolute_parent = self._registry.get_absolute_parent_path(block_id)
-            # Extract block name from block_id
-            block_name = block_id.split("/")[-1] if "/" in block_id else block_id
-            return absolute_parent, block_name
-        else:
-            # Fallback: parse block_id as relative path
-            if "/" in block_id:
-                parts = block_id.rsplit("/", 1)
-                return parts[0], parts[1]
-            return "", block_id
+            return _split_block_id(block_id, self._registry, self._registry.generation)
+        return _split_block_id(block_id, None, 0)
 
     def set_final_label(
         self, block_id: str, label: int, admin_username: str
@@ -205,37 +477,29 @@ class FinalLabelStore:
             self._data["labels"] = {}
         if parent_path not in self._data["labels"]:
             self._data["labels"][parent_path] = {}
-        self._data["labels"][parent_path][block_name] = {
+        ts = _now_iso()
+        entry = {
             "final_label": label,
             "set_by": admin_username,
-            "set_at": _now_iso(),
+            "set_at": ts,
         }
-        self._data["updated_at"] = _now_iso()
-        atomic_write_json(self._filepath, self._data)
+        self._data["labels"][parent_path][block_name] = entry
+        self._flat_labels[_flat_key(parent_path, block_name)] = entry
+        self._data["updated_at"] = ts
+        if self._writer is not None:
+            self._writer.write_json(self._filepath, _snapshot(self._data, "labels"))
+        else:
+            atomic_write_json(self._filepath, self._data)
 
     def get_final_label(self, block_id: str) -> Optional[int]:
         """Return the admin-set final label for *block_id*, or None."""
-        parent_path, block_name = self._get_storage_key(block_id)
-        return (
-            self._data.get("labels", {})
-            .get(parent_path, {})
-            .get(block_name, {})
-            .get("final_label")
-        )
+        entry = self._flat_labels.get(_flat_key(*self._get_storage_key(block_id)))
+        return entry.get("final_label") if entry is not None else None
 
-    def all_labels(self) -> dict:
-        """Return a copy of all {block_id: {...}} final label entries.
+    def all_labels(self) -> Mapping:
+        """Return a read-only view of all {storage_key: {...}} final label entries.
 
-        Flattens the nested structure back into a flat dictionary.
+        Live like :meth:`AnnotationStore.all_annotations`; take ``dict(...)``
+        of it for a snapshot.
         """
-        result = {}
-        labels = self._data.get("labels", {})
-        for parent_path, blocks in labels.items():
-            for block_name, data in blocks.items():
-                # Reconstruct block_id from parent_path and block_name
-                if parent_path:
-                    block_id = f"{parent_path}/{block_name}"
-                else:
-                    block_id = block_name
-                result[block_id] = data
-        return result
+        return MappingProxyType(self._flat_labels)
@@ -1,5 +1,6 @@
 """Discovers and indexes block_xxxx/ directories under the data root."""
 
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -9,6 +10,24 @@ from typing import Optional
 _BLOCK_PATTERN = re.compile(r"^block_\d{4}$")
 
 
+def _scan_tiffs(dirpath: str) -> list:
+    """Return a block's TIFF paths from one directory read.
+
+    ``*.tiff`` files come first, then ``*.tif``, each sorted by name;
+    extensions are matched case-insensitively.
+    """
+    tiff, tif = [], []
+    with os.scandir(dirpath) as it:
+        for e in it:
+            lower = e.name.lower()
+            if lower.endswith(".tiff"):
+                tiff.append(e.name)
+            elif lower.endswith(".tif"):
+                tif.append(e.name)
+    base = Path(dirpath)
+    return [base / name for name in sorted(tiff) + sorted(tif)]
+
+
 @dataclass
 class BlockInfo:
     """Metadata for one annotatable block."""
@@ -16,6 +35,7 @@ class BlockInfo:
     block_id: str
     path: Path
     tiff_files: list = field(default_factory=list)
+    index: int = -1  # position in BlockRegistry.all_blocks(); set by scan()
 
     @property
     def channel_count(self) -> int:
@@ -31,39 +51,65 @@ class BlockRegistry:
     def __init__(self, data_root: Path) -> None:
         self._data_root = Path(data_root)
         self._blocks: list[BlockInfo] = []
+        self._by_id: dict[str, BlockInfo] = {}
+        self._generation = 0
 
     @property
     def data_root(self) -> Path:
         return self._data_root
 
+    @property
+    def generation(self) -> int:
+        """Incremented on every scan(); lets callers invalidate derived caches."""
+        return self._generation
+
     def scan(self) -> None:
         """Populate the block list from the filesystem (recursive)."""
         self._blocks = []
+        self._by_id = {}
+        self._generation += 1
         if not self._data_root.exists():
             return
 
-        # Recursive scan using rglob
-        for entry in sorted(self._data_root.rglob("*")):
-            if entry.is_dir() and _BLOCK_PATTERN.match(entry.name):
-                tiffs = sorted(entry.glob("*.tiff")) + sorted(entry.glob("*.tif"))
-
-                # Compute relative path from data_root
-                try:
-                    rel_path = entry.relative_to(self._data_root)
-                    parent_rel = str(rel_path.parent) if rel_path.parent != Path(".") else ""
-                    block_id = str(rel_path) if parent_rel else entry.name
-                except ValueError:
-                    # Shouldn't happen, but fallback to name only
-                    block_id = entry.name
-                    parent_rel = ""
-
-                self._blocks.append(
-                    BlockInfo(
-                        block_id=block_id,
-                        path=entry,
-                        tiff_files=tiffs,
-                    )
+        # Recursive os.scandir walk: DirEntry.is_dir() reuses the readdir
+        # result, avoiding a stat per entry on network filesystems.  Like
+        # rglob, symlinked directories are reported but not descended into.
+        block_dirs: list[tuple[tuple[str, ...], str]] = []
+        stack: list[tuple[str, tuple[str, ...]]] = [(str(self._data_root), ())]
+        while stack:
+            dirpath, rel_parts = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    for e in it:
+                        try:
+                            if not e.is_dir():
+                                continue
+                        except OSError:
+                            continue
+                        parts = rel_parts + (e.name,)
+                        if _BLOCK_PATTERN.match(e.name):
+                            block_dirs.append((parts, e.path))
+                        if not e.is_symlink():
+                            stack.append((e.path, parts))
+            except OSError:
+                continue
+
+        # Same ordering as sorted(Path.rglob(...)): component-wise by path.
+        block_dirs.sort()
+        for rel_parts, dirpath in block_dirs:
+            # block_id is the path relative to data_root (just the name for
+            # blocks directly under the root).
+            block_id = "/".join(rel_parts)
+            self._blocks.append(
+                BlockInfo(
+                    block_id=block_id,
+                    path=Path(dirpath),
+                    tiff_files=_scan_tiffs(dirpath),
+                    index=len(self._blocks),
                 )
+            )
+
+        self._by_id = {b.block_id: b for b in self._blocks}
 
     def all_blocks(self) -> list:
         """Return all discovered blocks in sorted order."""
@@ -71,10 +117,26 @@ class BlockRegistry:
 
     def get_block(self, block_id: str) -> Optional[BlockInfo]:
         """Return the BlockInfo for *block_id*, or None if not found."""
-        for b in self._blocks:
-            if b.block_id == block_id:
-                return b
-        return None
+        return self._by_id.get(block_id)
+
+    def neighbors(self, block_id: str, radius: int = 2) -> list:
+        """Return the blocks within *radius* positions of *block_id*.
+
+        Ordered nearest-first with the forward neighbour before the backward
+        one at each distance (N+1, N-1, N+2, N-2, …), which matches the order
+        an annotator is most likely to visit them.  Returns an empty list if
+        *block_id* is unknown.
+        """
+        block = self._by_id.get(block_id)
+        if block is None:
+            return []
+        idx = block.index
+        result = []
+        for distance in range(1, radius + 1):
+            for ni in (idx + distance, idx - distance):
+                if 0 <= ni < len(self._blocks):
+                    result.append(self._blocks[ni])
+        return result
 
     def get_absolute_parent_path(self, block_id: str) -> str:
         """Return the absolute path to the parent directory of *block_id*.
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from aind_proteomics_annotator.models.annotation_store import (
     AnnotationStore,
     FinalLabelStore,
 )
-from aind_proteomics_annotator.utils.atomic_io import read_json
+from aind_proteomics_annotator.utils.atomic_io import JsonWriter, read_json
 
 if TYPE_CHECKING:
     from aind_proteomics_annotator.models.block_registry import BlockRegistry
@@ -31,13 +32,18 @@ class UserSession:
         self.username = username
         self.config = config
         self.is_admin: bool = False
+        # Label N (1-based) → class name at index N; index 0 is "no class".
+        self._class_by_label: tuple = ("",) + tuple(config.classes)
+        # Each store writes to disk from its own background thread.
+        self._writers = (JsonWriter(), JsonWriter())
         self.store = AnnotationStore(
             filepath=config.user_file(username),
             username=username,
             registry=registry,
+            writer=self._writers[0],
         )
         self.final_label_store = FinalLabelStore(
-            config.final_labels_file, registry=registry
+            config.final_labels_file, registry=registry, writer=self._writers[1]
         )
 
     def load_or_create(self) -> None:
@@ -45,12 +51,32 @@ class UserSession:
         self.config.users_dir.mkdir(parents=True, exist_ok=True)
         self.config.admin_dir.mkdir(parents=True, exist_ok=True)
 
-        self.store.load_or_create()
-        self.final_label_store.load()
-        self.is_admin = self._check_admin()
+        # The three reads are independent; overlap them so startup on a slow
+        # network mount costs the slowest read rather than the sum.
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            store_done = ex.submit(self.store.load_or_create)
+            labels_done = ex.submit(self.final_label_store.load)
+            roles_done = ex.submit(read_json, self.config.roles_file)
+            store_done.result()
+            labels_done.result()
+            roles = roles_done.result()
+        self.is_admin = self._check_admin(roles)
 
-    def _check_admin(self) -> bool:
-        roles = read_json(self.config.roles_file)
+    def class_name(self, label: int) -> str:
+        """Return the configured class name for *label*, or "" if unknown."""
+        names = self._class_by_label
+        return names[label] if 0 <= label < len(names) else ""
+
+    def close(self) -> None:
+        """Persist pending annotations and fold the journal into the snapshot.
+
+        Blocks until all queued writes are on disk. Call on clean exit.
+        """
+        self.store.compact()
+        for writer in self._writers:
+            writer.close()
+
+    def _check_admin(self, roles: dict | None) -> bool:
         if not roles:
             return False
         return self.username in roles.get("admins", [])
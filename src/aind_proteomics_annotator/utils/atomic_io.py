@@ -4,25 +4,122 @@ All annotation writes go through this module. The strategy:
   1. Write JSON to a UUID-suffixed temp file in the same directory (same filesystem).
   2. fsync the temp file so data reaches the NFS server before rename.
   3. os.replace() atomically renames temp → target.
-  4. fsync the directory fd so the rename is durable on NFS.
+  4. fsync the directory fd so the rename is durable on NFS (or once for a
+     whole group of writes, see :func:`batched_writes`).
 
 Readers use a retry loop to handle transiently stale NFS dentry caches.
+
+High-frequency updates can instead be appended to a JSON-lines journal with
+:func:`append_jsonl` (one small fsync'd append per batch) and folded back
+into the JSON snapshot periodically; :func:`read_jsonl` tolerates a torn
+final line left by a crash mid-append.
+
+:class:`JsonWriter` runs both kinds of write on a background thread, in
+submission order, so the GUI thread never blocks on fsync.
+
+JSON (snapshots and journal lines alike) is encoded/decoded with orjson
+when it is installed (``pip install aind-proteomics-annotator-gui[fast]``),
+falling back to the stdlib ``json``.  Both produce the same UTF-8 layout:
+2-space-indented snapshots and one compact record per journal line.
 """
 
 import json
 import os
+import threading
 import time
 import uuid
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Literal, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode *data* as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Encode *record* as one compact UTF-8 JSON line, newline included."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _fsync_dir(dirpath: Path) -> None:
+    """fsync directory *dirpath* so renames/creations in it are durable."""
+    try:
+        dir_fd = os.open(str(dirpath), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            # Some networked filesystems return EINVAL for fsync on dir fd.
+            pass
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass  # Non-critical: rename already succeeded
 
 
-def atomic_write_json(filepath: Path, data: Any) -> None:
+@contextmanager
+def batched_writes(dirpath: Path) -> Iterator[None]:
+    """Group ``durability="batched"`` writes under one directory fsync.
+
+    Usage::
+
+        with batched_writes(users_dir):
+            for path, data in updates:
+                atomic_write_json(path, data, durability="batched")
+    """
+    try:
+        yield
+    finally:
+        _fsync_dir(Path(dirpath))
+
+
+def atomic_write_json(
+    filepath: Path,
+    data: Any,
+    durability: Literal["strict", "batched", "none"] = "strict",
+) -> None:
     """Write *data* as JSON to *filepath* atomically.
 
     Safe for concurrent access from multiple machines on NFS/CIFS.
     The target file is either fully replaced or left untouched on failure.
+
+    *durability* trades crash safety for latency; the rename is atomic in
+    every mode:
+
+    ``"strict"``
+        fsync the file, then the directory after the rename (default).
+        The directory fsync is skipped when *filepath* already existed: the
+        rename then only swaps the inode behind an unchanged entry, so a
+        crash can at worst surface the previous complete file.  Callers
+        that must order the rename before another directory change (e.g.
+        deleting a file it supersedes) should use :func:`batched_writes`.
+    ``"batched"``
+        fsync the file only; the caller fsyncs the directory once for a
+        group of writes, e.g. with :func:`batched_writes`.
+    ``"none"``
+        no fsync at all; for UI state and caches that may be lost on a
+        crash.
     """
+    if durability not in ("strict", "batched", "none"):
+        raise ValueError(f"Unknown durability mode: {durability!r}")
     filepath = Path(filepath)
     dirpath = filepath.parent
     dirpath.mkdir(parents=True, exist_ok=True)
@@ -31,25 +128,18 @@ def atomic_write_json(filepath: Path, data: Any) -> None:
     tmp_path = dirpath / f".{filepath.stem}_{uuid.uuid4().hex}.tmp"
 
     try:
-        with open(tmp_path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
-            fh.flush()
-            os.fsync(fh.fileno())  # flush page cache → NFS server
+        with open(tmp_path, "wb") as fh:
+            fh.write(_dumps(data))
+            if durability != "none":
+                fh.flush()
+                os.fsync(fh.fileno())  # flush page cache → NFS server
 
+        existed = filepath.exists()
         os.replace(tmp_path, filepath)  # POSIX atomic rename
 
-        # Sync directory so the rename survives a crash on the NFS server.
-        try:
-            dir_fd = os.open(str(dirpath), os.O_RDONLY)
-            try:
-                os.fsync(dir_fd)
-            except OSError:
-                # Some networked filesystems return EINVAL for fsync on dir fd.
-                pass
-            finally:
-                os.close(dir_fd)
-        except OSError:
-            pass  # Non-critical: rename already succeeded
+        if durability == "strict" and not existed:
+            # Sync directory so the rename survives a crash on the NFS server.
+            _fsync_dir(dirpath)
 
     except Exception:
         if tmp_path.exists():
@@ -60,26 +150,196 @@ def atomic_write_json(filepath: Path, data: Any) -> None:
         raise
 
 
-def read_json(filepath: Path) -> Optional[Any]:
+# read_json retries transient failures for up to this long, polling from
+# 1 ms and doubling to at most 20 ms, so a reader that catches another
+# client mid-rename returns as soon as the new file is in place.
+_READ_RETRY_BUDGET_S = 0.15
+_READ_RETRY_MAX_SLEEP_S = 0.02
+
+
+def read_json(
+    filepath: Path, parse: Optional[Callable[[bytes], Any]] = None
+) -> Optional[Any]:
     """Read JSON from *filepath*, returning None if the file does not exist.
 
-    Retries up to 3 times on transient OSError / JSONDecodeError to handle
-    stale NFS dentry caches or in-progress renames on other clients.
+    Retries transient OSError / decode errors with short exponential
+    backoff (1 ms upwards, ~150 ms in total) to handle stale NFS dentry
+    caches or in-progress renames on other clients.
+
+    *parse* replaces the default decoder; it receives the raw file bytes
+    and should raise ``ValueError`` on malformed input.
     """
+    parse = parse or _loads
     filepath = Path(filepath)
     last_exc: Optional[Exception] = None
+    deadline = time.monotonic() + _READ_RETRY_BUDGET_S
+    delay = 0.001
+    attempts = 0
 
-    for attempt in range(3):
+    while True:
+        attempts += 1
         try:
             if not filepath.exists():
                 return None
-            with open(filepath, "r", encoding="utf-8") as fh:
-                return json.load(fh)
-        except (json.JSONDecodeError, OSError) as exc:
+            with open(filepath, "rb") as fh:
+                return parse(fh.read())
+        except (ValueError, OSError) as exc:
             last_exc = exc
-            if attempt < 2:
-                time.sleep(0.05 * (attempt + 1))
+        if time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, _READ_RETRY_MAX_SLEEP_S)
 
     raise RuntimeError(
-        f"Failed to read {filepath} after 3 attempts"
+        f"Failed to read {filepath} after {attempts} attempts"
     ) from last_exc
+
+
+def append_jsonl(filepath: Path, records: list) -> None:
+    """Append *records* to *filepath* as JSON lines and fsync once.
+
+    Creates the file (and parent directories) if needed.  Each record is
+    written on its own line so a crash can at worst leave one torn line.
+    If an earlier crash left such a torn tail, it is terminated first so
+    the new records do not run on into it.
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    payload = b"".join(_dumps_line(record) for record in records)
+    with open(filepath, "a+b") as fh:
+        if fh.seek(0, os.SEEK_END) > 0:
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                payload = b"\n" + payload
+        fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def read_jsonl(filepath: Path) -> list:
+    """Read all records from a JSON-lines file; missing file → empty list.
+
+    Lines that fail to parse (e.g. a torn trailing append) are skipped.
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        return []
+    records = []
+    with open(filepath, "rb") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(_loads(line))
+            except ValueError:  # JSONDecodeError, or a torn UTF-8 sequence
+                continue
+    return records
+
+
+class JsonWriter:
+    """Background writer thread for JSON snapshots and JSON-lines appends.
+
+    Tasks run strictly in submission order on a single daemon thread.  A
+    snapshot submitted while an older snapshot of the same file is still
+    queued replaces it in place, since only the latest state matters.
+
+    Everything queued when the thread wakes is written as one group
+    commit: each file is fsync'd, but each directory only once per batch.
+
+    Submitted data must not be mutated afterwards; pass a copy.  Submitting
+    after :meth:`close` raises RuntimeError rather than dropping the task.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: deque = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="JsonWriter", daemon=True
+        )
+        self._thread.start()
+
+    def write_json(
+        self, filepath: Path, data: Any, then_unlink: Optional[Path] = None
+    ) -> None:
+        """Queue an :func:`atomic_write_json`, optionally deleting *then_unlink* after."""
+        filepath = Path(filepath)
+        with self._cond:
+            self._check_open()
+            for i, task in enumerate(self._tasks):
+                if task[0] == "json" and task[1] == filepath:
+                    self._tasks[i] = ("json", filepath, data, then_unlink)
+                    return
+            self._tasks.append(("json", filepath, data, then_unlink))
+            self._cond.notify()
+
+    def append_jsonl(self, filepath: Path, records: list) -> None:
+        """Queue an :func:`append_jsonl` of *records* to *filepath*."""
+        with self._cond:
+            self._check_open()
+            self._tasks.append(("jsonl", Path(filepath), records, None))
+            self._cond.notify()
+
+    def wait(self) -> None:
+        """Block until every queued task has been written."""
+        with self._cond:
+            while self._tasks or self._busy:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Write all queued tasks, then stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _check_open(self) -> None:
+        # Caller holds self._cond.  The thread exits once drained, so a
+        # task queued now would never be written.
+        if self._closed:
+            raise RuntimeError("JsonWriter is closed")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._tasks and not self._closed:
+                    self._cond.wait()
+                if not self._tasks:
+                    return  # closed and drained
+                batch = list(self._tasks)
+                self._tasks.clear()
+                self._busy = True
+            dirty_dirs: set = set()
+            try:
+                for kind, filepath, payload, then_unlink in batch:
+                    try:
+                        if kind == "json" and then_unlink is not None:
+                            # The snapshot must be durable before the file
+                            # it supersedes disappears.
+                            with batched_writes(filepath.parent):
+                                atomic_write_json(
+                                    filepath, payload, durability="batched"
+                                )
+                            try:
+                                Path(then_unlink).unlink()
+                            except FileNotFoundError:
+                                pass
+                        elif kind == "json":
+                            atomic_write_json(filepath, payload, durability="batched")
+                        else:
+                            append_jsonl(filepath, payload)
+                        dirty_dirs.add(filepath.parent)
+                    except Exception as exc:
+                        print(f"[JsonWriter] Error writing {filepath}: {exc}")
+                # The NFS cost is the server round trip per COMMIT/RENAME,
+                # not the syscall; submitting the same chain through
+                # io_uring would still issue them one by one.  Amortising
+                # the directory fsync over the batch is what saves trips.
+                for dirpath in dirty_dirs:
+                    _fsync_dir(dirpath)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -1,8 +1,11 @@
 """Majority-vote consensus calculation for the admin review panel."""
 
-from collections import Counter
 from typing import Optional
 
+import numpy as np
+
+from aind_proteomics_annotator.utils.consensus_numba import compute_consensus_batch
+
 
 def compute_consensus(
     labels: list,
@@ -21,18 +24,22 @@ def compute_consensus(
         *has_disagreement* is True if the vote is not unanimous among
         the valid labels (ties count as disagreement).
     """
-    valid = [lbl for lbl in labels if lbl is not None]
-    if not valid:
-        return None, False
-
-    counter = Counter(valid)
-    has_disagreement = len(counter) > 1
-
-    max_count = counter.most_common(1)[0][1]
-    # All labels that share the highest vote count.
-    leaders = sorted(lbl for lbl, cnt in counter.items() if cnt == max_count)
-    consensus_label = leaders[0]  # tie-break: smallest label wins
+    # Single pass: tally votes while tracking the leader, so no Counter,
+    # most_common() or tie-break sort is needed.  Labels are arbitrary ints
+    # (the class list is configurable), hence a dict rather than a list.
+    counts: dict = {}
+    consensus_label = None
+    best_count = 0
+    for lbl in labels:
+        if lbl is None:
+            continue
+        cnt = counts.get(lbl, 0) + 1
+        counts[lbl] = cnt
+        # tie-break: smallest label wins
+        if cnt > best_count or (cnt == best_count and lbl < consensus_label):
+            consensus_label, best_count = lbl, cnt
 
+    has_disagreement = len(counts) > 1
     return consensus_label, has_disagreement
 
 
@@ -45,7 +52,9 @@ def build_consensus_table(
     Parameters
     ----------
     all_user_annotations:
-        ``{username: {block_id: {"label": int, ...}}}``
+        ``{username: {block_id: {"label": int, ...}}}``, or the lighter
+        ``{username: {block_id: int}}`` from
+        :func:`~aind_proteomics_annotator.models.annotation_store.load_annotation_labels`.
     block_ids:
         Ordered list of all block IDs (from :class:`BlockRegistry`).
 
@@ -61,7 +70,9 @@ def build_consensus_table(
         for username, annotations in all_user_annotations.items():
             entry = annotations.get(block_id)
             if entry:
-                user_labels[username] = entry.get("label")
+                user_labels[username] = (
+                    entry.get("label") if isinstance(entry, dict) else entry
+                )
 
         consensus, disagreement = compute_consensus(list(user_labels.values()))
         rows.append(
@@ -73,3 +84,58 @@ def build_consensus_table(
             }
         )
     return rows
+
+
+def build_consensus_table_fast(
+    all_user_annotations: dict,
+    block_ids: list,
+) -> list:
+    """Vectorised equivalent of :func:`build_consensus_table`.
+
+    Walks each user's annotations once (O(annotations) rather than
+    O(blocks × users) dict lookups), packs the votes into a dense
+    (block, user) code matrix and tallies every row with
+    :func:`~aind_proteomics_annotator.utils.consensus_numba.compute_consensus_batch`.
+    Takes the same input and returns identical rows.
+    """
+    row_of = {block_id: i for i, block_id in enumerate(block_ids)}
+    user_labels: list = [{} for _ in block_ids]
+    vote_rows: list = []
+    vote_users: list = []
+    vote_labels: list = []
+    for col, (username, annotations) in enumerate(all_user_annotations.items()):
+        for block_id, entry in annotations.items():
+            row = row_of.get(block_id)
+            if row is None or not entry:
+                continue
+            label = entry.get("label") if isinstance(entry, dict) else entry
+            user_labels[row][username] = label
+            if label is not None:
+                vote_rows.append(row)
+                vote_users.append(col)
+                vote_labels.append(label)
+
+    n_blocks = len(block_ids)
+    consensus: list = [None] * n_blocks
+    disagreement = [False] * n_blocks
+    if vote_rows:
+        # Sorted unique labels → codes, so the kernel's smallest-code
+        # tie-break reproduces the smallest-label rule.
+        uniq, codes = np.unique(np.asarray(vote_labels), return_inverse=True)
+        mat = np.full((n_blocks, len(all_user_annotations)), -1, dtype=np.int64)
+        mat[vote_rows, vote_users] = codes
+        winners, distinct = compute_consensus_batch(mat)
+        leaders = uniq[np.maximum(winners, 0)].tolist()
+        for i in np.flatnonzero(winners >= 0).tolist():
+            consensus[i] = leaders[i]
+        disagreement = distinct.tolist()
+
+    return [
+        {
+            "block_id": block_id,
+            "user_labels": user_labels[i],
+            "consensus": consensus[i],
+            "disagreement": disagreement[i],
+        }
+        for i, block_id in enumerate(block_ids)
+    ]
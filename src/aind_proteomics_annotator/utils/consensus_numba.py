@@ -0,0 +1,94 @@
+"""Batch majority vote over a dense (blocks × users) label-code matrix.
+
+Used by :func:`~aind_proteomics_annotator.utils.consensus.build_consensus_table_fast`
+for long-running studies with O(100k) blocks.  When numba is installed
+(``pip install aind-proteomics-annotator-gui[fast]``) large matrices are
+tallied by a JIT-compiled kernel parallelised over rows; otherwise, and for
+small matrices where compilation would dominate, a NumPy ``bincount``
+fallback produces identical results.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # optional speedup
+    numba = None
+
+# Below this many cells the one-off JIT compile costs more than it saves.
+_JIT_MIN_CELLS = 1_000_000
+
+
+def _consensus_numpy(mat: np.ndarray, n_labels: int) -> tuple:
+    """Tally every row at once with a single ``np.bincount`` over (row, code)."""
+    n = mat.shape[0]
+    valid = mat >= 0
+    rows = np.nonzero(valid)[0]
+    counts = np.bincount(
+        rows * n_labels + mat[valid], minlength=n * n_labels
+    ).reshape(n, n_labels)
+    # argmax returns the first maximum, i.e. the smallest code on ties.
+    consensus = np.where(counts.any(axis=1), counts.argmax(axis=1), -1)
+    disagreement = np.count_nonzero(counts, axis=1) > 1
+    return consensus.astype(np.int64), disagreement
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _consensus_kernel(mat, n_labels):
+        n, m = mat.shape
+        consensus = np.full(n, -1, np.int64)
+        disagreement = np.zeros(n, np.bool_)
+        for i in numba.prange(n):
+            tally = np.zeros(n_labels, np.int64)
+            for j in range(m):
+                v = mat[i, j]
+                if v >= 0:
+                    tally[v] += 1
+            best = -1
+            best_count = 0
+            distinct = 0
+            for k in range(n_labels):
+                c = tally[k]
+                if c > 0:
+                    distinct += 1
+                    # Strict ">" keeps the smallest code on ties.
+                    if c > best_count:
+                        best = k
+                        best_count = c
+            consensus[i] = best
+            disagreement[i] = distinct > 1
+        return consensus, disagreement
+
+else:
+    _consensus_kernel = None
+
+
+def compute_consensus_batch(labels_matrix: np.ndarray) -> tuple:
+    """Majority vote for every row of *labels_matrix*.
+
+    Parameters
+    ----------
+    labels_matrix:
+        Integer array of shape (n_blocks, n_users).  Each cell holds a
+        non-negative label code, or ``-1`` where that user has not voted.
+        Codes index a tally array, so they should be small and dense
+        (e.g. the inverse from ``np.unique``).
+
+    Returns
+    -------
+    (consensus, disagreement)
+        ``consensus`` is an int64 array of winning codes (``-1`` for rows
+        with no votes; ties go to the smallest code).  ``disagreement`` is
+        a bool array, True where a row received more than one distinct code.
+    """
+    mat = np.ascontiguousarray(labels_matrix, dtype=np.int64)
+    if mat.ndim != 2:
+        raise ValueError(f"labels_matrix must be 2-D, got shape {mat.shape}")
+    n_labels = int(mat.max()) + 1 if mat.size else 0
+    if n_labels <= 0:
+        return np.full(mat.shape[0], -1, np.int64), np.zeros(mat.shape[0], bool)
+    if _consensus_kernel is not None and mat.size >= _JIT_MIN_CELLS:
+        return _consensus_kernel(mat, n_labels)
+    return _consensus_numpy(mat, n_labels)
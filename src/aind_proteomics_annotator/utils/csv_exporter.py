@@ -2,12 +2,26 @@
 
 import csv
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Mapping
+
+_FIXED_COLUMNS = ("block_id", "consensus_label", "final_label", "has_disagreement")
+
+
+@lru_cache(maxsize=8)
+def _user_columns(usernames: frozenset) -> tuple[tuple, tuple]:
+    """Return (sorted usernames, their column names) for a set of users.
+
+    Cached because the admin panel re-exports with the same annotators.
+    """
+    users = tuple(sorted(usernames))
+    return users, tuple(f"user_{u}_label" for u in users)
 
 
 def export_csv(
     consensus_rows: list,
-    final_labels: dict,
+    final_labels: Mapping,
     output_path: Path,
     usernames: list,
 ) -> None:
@@ -18,7 +32,9 @@ def export_csv(
     consensus_rows:
         Output of :func:`build_consensus_table` – one dict per block.
     final_labels:
-        Output of :meth:`FinalLabelStore.all_labels`.
+        ``{block_id: entry}`` final labels, i.e.
+        :meth:`FinalLabelStore.all_labels` re-keyed with
+        :func:`rekey_by_block_id`.
     output_path:
         Destination path for the CSV file.
     usernames:
@@ -33,28 +49,31 @@ def export_csv(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    sorted_users = sorted(usernames)
-    fieldnames = (
-        ["block_id", "consensus_label", "final_label", "has_disagreement"]
-        + [f"user_{u}_label" for u in sorted_users]
-        + ["exported_at"]
-    )
+    sorted_users, user_columns = _user_columns(frozenset(usernames))
+    fieldnames = (*_FIXED_COLUMNS, *user_columns, "exported_at")
     exported_at = datetime.now(timezone.utc).isoformat()
 
     with open(output_path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for row in consensus_rows:
-            fl_entry = final_labels.get(row["block_id"], {})
-            csv_row: dict = {
-                "block_id": row["block_id"],
-                "consensus_label": row["consensus"] if row["consensus"] is not None else "",
-                "final_label": fl_entry.get("final_label", ""),
-                "has_disagreement": row["disagreement"],
-                "exported_at": exported_at,
-            }
-            for u in sorted_users:
-                csv_row[f"user_{u}_label"] = row["user_labels"].get(u, "")
-
-            writer.writerow(csv_row)
+        writer = csv.writer(fh)
+        writer.writerow(fieldnames)
+
+        # Positional rows in fieldnames order, streamed through writerows;
+        # avoids DictWriter's per-row dict and per-field lookups.
+        get_final = final_labels.get
+        no_final: dict = {}
+
+        def _rows():
+            for row in consensus_rows:
+                block_id = row["block_id"]
+                consensus = row["consensus"]
+                get_user = row["user_labels"].get
+                yield (
+                    block_id,
+                    "" if consensus is None else consensus,
+                    get_final(block_id, no_final).get("final_label", ""),
+                    row["disagreement"],
+                    *[get_user(u, "") for u in sorted_users],
+                    exported_at,
+                )
+
+        writer.writerows(_rows())
@@ -0,0 +1,202 @@
+"""Two-queue block cache shared by the load and preload workers.
+
+Kept free of napari/Qt imports so it can be unit-tested on its own.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Literal, Optional
+
+import numpy as np
+
+
+def _resident_nbytes(arr: np.ndarray) -> int:
+    """Bytes *arr* pins in RAM; memory-mapped files are paged by the OS."""
+    return 0 if isinstance(arr, np.memmap) else arr.nbytes
+
+
+class BlockCache:
+    """Two-queue (2Q) cache mapping block_id → list of channel arrays.
+
+    Blocks the user opened go into a *hot* LRU queue.  Speculative preloads
+    go into a *cold* FIFO queue and are promoted to hot on their first hit.
+    As in classic 2Q, cold is entitled to a quarter of each budget: while
+    it holds more than that, evictions come from cold (oldest first), so a
+    burst of preloads cannot flush the blocks the user just viewed and may
+    step back to; hot blocks are evicted, least recently used first, only
+    once cold is within its share.  During sequential navigation stale
+    preloads therefore age out of cold while hot keeps at least three
+    quarters of the cache.
+
+    Budgets are *max_size* blocks and *max_bytes* of array data, so a few
+    very large blocks cannot exhaust memory while many small ones can stay
+    resident.  The most recently inserted block is always kept, even if it
+    alone exceeds the byte budget.  Memory-mapped channels count as zero
+    bytes: their pages live in the OS page cache and are reclaimed by the
+    kernel.
+
+    Thread-safe: load and preload workers insert from background threads
+    while the Qt main thread reads.  Workers also register the blocks they
+    are decoding (:meth:`claim_load` / :meth:`end_load`), so a block is
+    never decoded twice at once: preloads skip in-flight blocks and the
+    foreground load waits for an in-flight preload (:meth:`wait_load`)
+    instead of starting its own decode.
+    """
+
+    def __init__(self, max_size: int = 3, max_bytes: Optional[int] = None) -> None:
+        # OrderedDict is already a hash map over a doubly-linked list, in C:
+        # move_to_end()/popitem() relink pointers in O(1), faster than any
+        # Python-level node list could.
+        self._hot: OrderedDict[str, list] = OrderedDict()
+        self._cold: OrderedDict[str, list] = OrderedDict()
+        self._nbytes: dict[str, int] = {}
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._used_bytes = 0
+        self._hot_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._loading: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, block_id: str) -> bool:
+        """Membership test that does not touch LRU order or hit statistics."""
+        with self._lock:
+            return block_id in self._hot or block_id in self._cold
+
+    def is_loading(self, block_id: str) -> bool:
+        """True while some worker holds a :meth:`claim_load` on *block_id*."""
+        with self._lock:
+            return block_id in self._loading
+
+    def claim_load(self, block_id: str) -> bool:
+        """Mark *block_id* as being decoded by the caller.
+
+        Returns False if it is already cached or claimed by another worker;
+        otherwise the caller must call :meth:`end_load` when done (after
+        :meth:`put`, or on failure).
+        """
+        with self._lock:
+            if (
+                block_id in self._hot
+                or block_id in self._cold
+                or block_id in self._loading
+            ):
+                return False
+            self._loading[block_id] = threading.Event()
+            return True
+
+    def end_load(self, block_id: str) -> None:
+        """Release a :meth:`claim_load` and wake any :meth:`wait_load` callers."""
+        with self._lock:
+            done = self._loading.pop(block_id, None)
+        if done is not None:
+            done.set()
+
+    def wait_load(self, block_id: str, timeout: Optional[float] = None) -> None:
+        """Block until no worker is decoding *block_id* (or *timeout* expires)."""
+        with self._lock:
+            done = self._loading.get(block_id)
+        if done is not None:
+            done.wait(timeout)
+
+    def get(self, block_id: str) -> Optional[list]:
+        """Return cached arrays for *block_id*, or None if not cached."""
+        with self._lock:
+            arrays = self._hot.get(block_id)
+            if arrays is not None:
+                self._hot.move_to_end(block_id)
+            else:
+                arrays = self._promote(block_id)
+            if arrays is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return arrays
+
+    def put(
+        self,
+        block_id: str,
+        arrays: list,
+        source: Literal["user", "preload"] = "user",
+    ) -> None:
+        """Cache *arrays* for *block_id*, evicting entries if over budget.
+
+        *source* selects the queue: ``"user"`` for blocks being displayed,
+        ``"preload"`` for speculative neighbours.
+        """
+        with self._lock:
+            if block_id in self._hot:
+                self._hot.move_to_end(block_id)
+                return
+            if block_id in self._cold:
+                if source == "user":
+                    self._promote(block_id)
+                return
+            nbytes = sum(_resident_nbytes(a) for a in arrays)
+            self._nbytes[block_id] = nbytes
+            self._used_bytes += nbytes
+            if source == "user":
+                self._hot[block_id] = arrays
+                self._hot_bytes += nbytes
+            else:
+                self._cold[block_id] = arrays
+            self._evict(keep=block_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hot.clear()
+            self._cold.clear()
+            self._nbytes.clear()
+            self._used_bytes = 0
+            self._hot_bytes = 0
+
+    def stats(self) -> dict:
+        """Return a snapshot of occupancy and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "blocks": len(self._hot) + len(self._cold),
+                "hot_blocks": len(self._hot),
+                "bytes": self._used_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    # Internal helpers; the caller holds self._lock.
+
+    def _promote(self, block_id: str) -> Optional[list]:
+        """Move *block_id* from cold to hot; return its arrays (None if absent)."""
+        arrays = self._cold.pop(block_id, None)
+        if arrays is not None:
+            self._hot[block_id] = arrays
+            self._hot_bytes += self._nbytes[block_id]
+        return arrays
+
+    def _over(self, count: int, nbytes: int) -> bool:
+        return count > self._max_size or (
+            self._max_bytes is not None and nbytes > self._max_bytes
+        )
+
+    def _evict(self, keep: str) -> None:
+        while self._over(len(self._hot) + len(self._cold), self._used_bytes):
+            cold_bytes = self._used_bytes - self._hot_bytes
+            cold_over_share = self._over(4 * len(self._cold), 4 * cold_bytes)
+            queues = (self._cold, self._hot) if cold_over_share else (self._hot, self._cold)
+            # Oldest entry of the preferred non-empty queue, never *keep*.
+            victim = next(
+                ((q, k) for q in queues for k in q if k != keep), None
+            )
+            if victim is None:
+                break
+            queue, old_id = victim
+            del queue[old_id]
+            nbytes = self._nbytes.pop(old_id)
+            self._used_bytes -= nbytes
+            if queue is self._hot:
+                self._hot_bytes -= nbytes
+            self._evictions += 1
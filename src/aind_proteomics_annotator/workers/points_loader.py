@@ -0,0 +1,53 @@
+"""Async loader for per-folder ``local_points.npy`` focus-point tables.
+
+Runs the filesystem probing and ``np.load`` calls in a background QThread so
+startup and data-root changes don't stall the GUI on slow network mounts.
+
+Usage
+-----
+worker = load_focus_points_worker(folders)
+worker.returned.connect(callback)   # callback receives {resolved_folder: (N, 3) array}
+worker.start()
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from napari.qt.threading import thread_worker
+
+
+@thread_worker
+def load_focus_points_worker(folders: list) -> dict:
+    """Background worker that loads ``local_points.npy`` from each folder.
+
+    Parameters
+    ----------
+    folders:
+        Candidate folders (Path objects) that may contain ``local_points.npy``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Maps the resolved folder path to its memory-mapped (N, 3) array.
+        Folders with a missing or malformed file are skipped.
+    """
+    points_by_folder: dict[str, np.ndarray] = {}
+    for folder in folders:
+        npy_path = Path(folder) / "local_points.npy"
+        if not npy_path.exists():
+            continue
+        try:
+            # Memory-map: only the row for the displayed block is ever read.
+            points = np.load(npy_path, mmap_mode="r")
+            if points.ndim != 2 or points.shape[1] != 3:
+                print(
+                    f"[PointsLoader] Skipping {npy_path}: "
+                    f"expected shape (N, 3), got {points.shape}"
+                )
+                continue
+            points_by_folder[str(Path(folder).resolve())] = points
+        except Exception as exc:
+            print(f"[PointsLoader] Could not load {npy_path}: {exc}")
+    return points_by_folder
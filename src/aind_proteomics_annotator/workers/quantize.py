@@ -0,0 +1,34 @@
+"""uint8 display quantization applied by the load workers before caching.
+
+Kept free of napari/Qt imports so it can be unit-tested on its own.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def quantize_to_uint8(arr: np.ndarray) -> np.ndarray:
+    """Contrast-stretch *arr* to uint8 using its 1st/99th percentiles.
+
+    Percentiles are estimated on a strided subsample, ignoring NaNs; NaN
+    voxels map to 0 and ±inf saturate to 0/255.
+    """
+    sample = arr[(slice(None, None, 4),) * arr.ndim]
+    finite = sample[np.isfinite(sample)]
+    if finite.size:
+        lo, hi = np.percentile(finite, [1, 99])
+    else:
+        lo, hi = 0.0, 1.0
+    if hi <= lo:
+        hi = lo + 1.0
+    out = np.subtract(arr, lo, dtype=np.float32)
+    out *= 255.0 / (hi - lo)
+    np.nan_to_num(out, copy=False, nan=0.0, posinf=255.0, neginf=0.0)
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
+
+
+def quantize_channels(arrays: list) -> list:
+    """Quantize the floating-point channels of *arrays*; others pass through."""
+    return [quantize_to_uint8(a) if a.dtype.kind == "f" else a for a in arrays]
@@ -0,0 +1,86 @@
+"""Subprocess TIFF decoding with a shared-memory hand-off.
+
+tifffile holds the GIL for part of every decode, so channel and preload
+threads partly serialise on it.  :class:`DecodePool` runs the decode in
+worker processes instead; each worker writes its result into a
+``multiprocessing.shared_memory`` block and returns only
+``(name, shape, dtype)``, so the pixel data never goes through pickle.
+
+This module deliberately imports nothing from Qt or napari: worker
+processes are started with the ``spawn`` method and re-import it.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import multiprocessing
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import tifffile
+
+
+def _decode_to_shm(path: str) -> tuple[str, tuple, str]:
+    """Decode *path* into a new shared-memory block (runs in a worker)."""
+    arr = tifffile.imread(path)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    del view  # release the buffer export before closing
+    shm.close()
+    return shm.name, arr.shape, arr.dtype.str
+
+
+def _take_from_shm(name: str, shape: tuple, dtype: str) -> np.ndarray:
+    """Copy a worker's result out of shared memory and free the block."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        arr = view.copy()
+        del view
+    finally:
+        shm.close()
+        shm.unlink()
+    return arr
+
+
+class DecodePool:
+    """Process pool that decodes TIFF files to C-contiguous arrays.
+
+    Parameters
+    ----------
+    max_workers:
+        Number of decode processes.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            # fork() is unsafe once Qt and its threads are running.
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def load(self, paths: list) -> list:
+        """Decode *paths* in parallel, returning arrays in input order."""
+        futures = [
+            self._executor.submit(_decode_to_shm, str(Path(p))) for p in paths
+        ]
+        arrays: list = []
+        error: BaseException | None = None
+        # Collect every result, even after a failure, so no block is leaked.
+        for fut in futures:
+            try:
+                result = fut.result()
+            except BaseException as exc:
+                error = error or exc
+                continue
+            arr = _take_from_shm(*result)
+            if error is None:
+                arrays.append(arr)
+        if error is not None:
+            raise error
+        return arrays
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
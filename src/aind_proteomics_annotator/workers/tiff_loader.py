@@ -14,7 +14,8 @@ worker.start()
 from __future__ import annotations
 
 import concurrent.futures
-from collections import OrderedDict
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -22,48 +23,150 @@ import numpy as np
 import tifffile
 from napari.qt.threading import thread_worker
 
+from aind_proteomics_annotator.workers.block_cache import BlockCache
+from aind_proteomics_annotator.workers.quantize import quantize_channels
+from aind_proteomics_annotator.workers.shm_decode import DecodePool
 
-class BlockCache:
-    """Simple LRU cache mapping block_id → list of channel arrays.
+# Module-level cache; replaced per-Viewer if needed.
+_default_cache = BlockCache()
 
-    Not thread-safe; access only from the Qt main thread.
-    """
+# Upper bound on concurrent channel reads; enough to overlap network-mount
+# round trips without flooding the file server.
+_MAX_CHANNEL_READERS = 8
+
+# Shared by the load and preload workers (created on first use), so threads
+# are not spawned and torn down for every block.
+_io_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_MAX_CHANNEL_READERS, thread_name_prefix="tiff-io"
+            )
+        return _io_executor
+
+# Optional subprocess decoder; None means decode on a thread pool.
+_decode_pool: Optional[DecodePool] = None
 
-    def __init__(self, max_size: int = 3) -> None:
-        self._cache: OrderedDict[str, list] = OrderedDict()
-        self._max_size = max_size
 
-    def get(self, block_id: str) -> Optional[list]:
-        """Return cached arrays for *block_id*, or None if not cached."""
-        if block_id in self._cache:
-            self._cache.move_to_end(block_id)
-            return self._cache[block_id]
+def configure_decode_processes(max_workers: int) -> None:
+    """Decode TIFFs in *max_workers* subprocesses (0 = in-process threads)."""
+    global _decode_pool
+    if _decode_pool is not None:
+        _decode_pool.shutdown()
+        _decode_pool = None
+    if max_workers > 0:
+        _decode_pool = DecodePool(max_workers)
+
+
+def _memmap_channel(path: Path) -> Optional[np.ndarray]:
+    """Return a read-only memory map of *path*, or None if it can't be mapped.
+
+    Only uncompressed, contiguously stored TIFFs can be mapped (tifffile
+    raises ValueError otherwise), and some network filesystems refuse
+    mmap() itself (OSError); the caller then decodes the file instead.
+    When mapping works, the OS pages in just the Z planes napari draws.
+    """
+    try:
+        return tifffile.memmap(str(path), mode="r")
+    except (ValueError, OSError):
         return None
 
-    def put(self, block_id: str, arrays: list) -> None:
-        """Cache *arrays* for *block_id*, evicting the oldest entry if full."""
-        if block_id in self._cache:
-            self._cache.move_to_end(block_id)
-        else:
-            if len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
-            self._cache[block_id] = arrays
 
-    def clear(self) -> None:
-        self._cache.clear()
+def _open_channel(path: Path):
+    """Memory-map *path*, or read only its header.
 
+    Returns the mapped array, or a ``(shape, dtype)`` tuple describing the
+    array a decode will produce.
+    """
+    mapped = _memmap_channel(path)
+    if mapped is not None:
+        return mapped
+    with tifffile.TiffFile(str(path)) as tif:
+        series = tif.series[0]
+        return tuple(series.shape), series.dtype
 
-# Module-level cache; replaced per-Viewer if needed.
-_default_cache = BlockCache()
 
+# Decoded channels are cached in their source dtype, except float64, which
+# is narrowed to float32: display needs far less precision and it halves the
+# block's footprint in BlockCache.  Integer data is never converted.
+_CACHE_DTYPES = {np.dtype(np.float64): np.dtype(np.float32)}
+
+
+def _cache_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    return _CACHE_DTYPES.get(dtype, dtype)
+
+
+def _decode_into(
+    path: Path, out: np.ndarray, src_dtype: np.dtype, maxworkers: int
+) -> None:
+    """Decode *path* into *out*, narrowing from *src_dtype* if they differ.
+
+    *maxworkers* bounds tifffile's own threads for decompressing the file's
+    pages/tiles (C codecs from imagecodecs release the GIL).
+    """
+    if out.dtype == src_dtype:
+        tifffile.imread(str(path), out=out, maxworkers=maxworkers)
+    else:
+        out[...] = tifffile.imread(str(path), maxworkers=maxworkers)
 
-def _load_channel(path: Path) -> np.ndarray:
-    """Load a single TIFF file and return a C-contiguous array."""
-    return np.ascontiguousarray(tifffile.imread(str(path)))
+
+def _load_channels(paths: list) -> list:
+    """Load all channel files of a block concurrently, preserving order.
+
+    Channels that must be decoded and share a shape and dtype are decoded
+    straight into one pre-allocated ``(C, Z, Y, X)`` array; the returned
+    list holds its per-channel (C-contiguous) views.
+    """
+    pool = _decode_pool
+    if pool is not None:
+        arrays = [_memmap_channel(p) for p in paths]
+        todo = [i for i, a in enumerate(arrays) if a is None]
+        for i, arr in zip(todo, pool.load([paths[i] for i in todo])):
+            arrays[i] = arr.astype(_cache_dtype(arr.dtype), copy=False)
+        return arrays
+    executor = _get_io_executor()
+    arrays = list(executor.map(_open_channel, paths))
+    todo = [i for i, a in enumerate(arrays) if isinstance(a, tuple)]
+    if not todo:
+        return arrays
+    layouts = {(arrays[i][0], _cache_dtype(arrays[i][1])) for i in todo}
+    if len(layouts) == 1:
+        shape, dtype = layouts.pop()
+        outs = list(np.empty((len(todo), *shape), dtype=dtype))
+    else:
+        outs = [
+            np.empty(arrays[i][0], dtype=_cache_dtype(arrays[i][1])) for i in todo
+        ]
+    # Split the cores between the channels decoding side by side so the
+    # per-file codec threads don't oversubscribe the machine.
+    maxworkers = max(1, (os.cpu_count() or 1) // min(len(todo), _MAX_CHANNEL_READERS))
+    list(
+        executor.map(
+            _decode_into,
+            [paths[i] for i in todo],
+            outs,
+            [arrays[i][1] for i in todo],
+            [maxworkers] * len(todo),
+        )
+    )
+    for i, out in zip(todo, outs):
+        arrays[i] = out
+    return arrays
 
 
 @thread_worker
-def load_block_worker(tiff_paths: list, block_id: str, cache: Optional[BlockCache] = None):
+def load_block_worker(
+    tiff_paths: list,
+    block_id: str,
+    cache: Optional[BlockCache] = None,
+    quantize: bool = False,
+):
     """Background worker that loads all channels for a block.
 
     Parameters
@@ -74,44 +177,69 @@ def load_block_worker(tiff_paths: list, block_id: str, cache: Optional[BlockCach
         Identifier for the block (used as cache key).
     cache:
         BlockCache instance. Defaults to the module-level cache if None.
+    quantize:
+        Convert float channels to uint8 with
+        :func:`~aind_proteomics_annotator.workers.quantize.quantize_channels`
+        here, off the GUI thread, before they are cached.
 
     Yields / Returns
     ----------------
     tuple[str, list[np.ndarray]]
         (block_id, list_of_channel_arrays).  Each array has shape (Z, Y, X)
-        in the source dtype.
+        in the source dtype (decoded float64 is narrowed to float32);
+        uncompressed files come back as read-only ``np.memmap`` views.
     """
     _cache = cache if cache is not None else _default_cache
 
-    cached = _cache.get(block_id)
-    if cached is not None:
-        return block_id, cached
-
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        arrays = list(executor.map(_load_channel, tiff_paths))
-
-    _cache.put(block_id, arrays)
+    # Adopt an in-flight preload of this block rather than decoding it a
+    # second time on the same I/O pool.
+    while True:
+        _cache.wait_load(block_id)
+        cached = _cache.get(block_id)
+        if cached is not None:
+            return block_id, cached
+        if _cache.claim_load(block_id):
+            break
+
+    try:
+        arrays = _load_channels(tiff_paths)
+        if quantize:
+            arrays = quantize_channels(arrays)
+        _cache.put(block_id, arrays)
+    finally:
+        _cache.end_load(block_id)
     return block_id, arrays
 
 
 @thread_worker
-def preload_block_worker(block_infos: list, cache: BlockCache):
+def preload_block_worker(block_infos: list, cache: BlockCache, quantize: bool = False):
     """Background worker that pre-warms the cache for a list of BlockInfo objects.
 
-    Skips any block_id already present in the cache.  The return value is
+    Skips any block_id already cached or being decoded by another worker
+    (see :meth:`BlockCache.claim_load`).  The return value is
     intentionally ignored by the caller — the side-effect of populating the
     cache is all that matters.
 
+    Yields each block_id after it is cached, so the worker can be stopped
+    between blocks with ``worker.quit()`` when the user navigates away.
+
     Parameters
     ----------
     block_infos:
         Ordered list of :class:`BlockInfo` objects to preload.
     cache:
         The shared :class:`BlockCache` instance.
+    quantize:
+        As for :func:`load_block_worker`.
     """
     for info in block_infos:
-        if cache.get(info.block_id) is not None:
-            continue  # already cached
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            arrays = list(executor.map(_load_channel, info.tiff_files))
-        cache.put(info.block_id, arrays)
+        if not cache.claim_load(info.block_id):
+            continue  # already cached or in flight
+        try:
+            arrays = _load_channels(info.tiff_files)
+            if quantize:
+                arrays = quantize_channels(arrays)
+            cache.put(info.block_id, arrays, source="preload")
+        finally:
+            cache.end_load(info.block_id)
+        yield info.block_id
@@ -4,10 +4,18 @@ from pathlib import Path
 
 import pytest
 
+from aind_proteomics_annotator.models import annotation_store
 from aind_proteomics_annotator.models.annotation_store import (
     AnnotationStore,
     FinalLabelStore,
+    journal_path,
+    load_annotation_file,
+    load_annotation_labels,
+    rekey_by_block_id,
+    storage_key,
 )
+from aind_proteomics_annotator.models.block_registry import BlockRegistry
+from aind_proteomics_annotator.utils.atomic_io import JsonWriter, read_json
 
 
 class TestAnnotationStore:
@@ -48,6 +56,8 @@ class TestAnnotationStore:
         anns = store.all_annotations()
         assert "block_0001" in anns
         assert anns["block_0001"]["label"] == 1
+        with pytest.raises(TypeError):
+            anns["block_0002"] = {"label": 2}
 
     def test_label_persists_across_instances(self, tmp_path: Path) -> None:
         """Setting a label should persist when the store is reloaded."""
@@ -68,6 +78,150 @@ class TestAnnotationStore:
         store.set_label("block_0001", 2)
         assert store.get_label("block_0001") == 2
 
+    def test_clear_label(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 1)
+        store.clear_label("block_0001")
+        assert store.get_label("block_0001") is None
+        assert store.annotated_block_ids() == set()
+
+    def test_nested_parent_paths_indexed_on_load(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice.json"
+        store1 = AnnotationStore(fp, "alice")
+        store1.load_or_create()
+        store1.set_label("sub/block_0001", 2)
+
+        store2 = AnnotationStore(fp, "alice")
+        store2.load_or_create()
+        assert store2.get_label("sub/block_0001") == 2
+        assert store2.annotated_block_ids() == {"sub/block_0001"}
+
+    def test_set_label_appends_to_journal(self, tmp_path: Path) -> None:
+        """Label changes go to the journal; the snapshot is left untouched."""
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 1)
+        store.clear_label("block_0001")
+        store.set_label("block_0002", 3)
+        assert read_json(fp)["annotations"] == {}
+        assert len(journal_path(fp).read_text().splitlines()) == 3
+
+        data = load_annotation_file(fp)
+        assert list(data["annotations"][""]) == ["block_0002"]
+        assert data["annotations"][""]["block_0002"]["label"] == 3
+
+    def test_load_annotation_labels(self, tmp_path: Path) -> None:
+        """Label-only loading sees compacted and journalled labels alike."""
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 1)
+        store.compact()
+        store.set_label("block_0002", 3)
+        store.clear_label("block_0001")
+        assert load_annotation_labels(fp) == {storage_key("block_0002"): 3}
+
+    def test_load_annotation_labels_ignores_other_json(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice_display.json"
+        fp.write_text('{"channels": {}}')
+        assert load_annotation_labels(fp) is None
+
+    def test_compact_folds_journal_into_snapshot(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 2)
+        store.compact()
+        assert not journal_path(fp).exists()
+        assert read_json(fp)["annotations"][""]["block_0001"]["label"] == 2
+
+    def test_stale_journal_compacted_on_flush(self, tmp_path: Path, monkeypatch) -> None:
+        """A journal older than the compaction interval is folded on flush."""
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 2)
+        assert journal_path(fp).exists()
+        monkeypatch.setattr(annotation_store, "_COMPACT_INTERVAL_S", -1.0)
+        store.set_label("block_0002", 1)
+        assert not journal_path(fp).exists()
+        assert read_json(fp)["annotations"][""] == {
+            "block_0001": store.all_annotations()["block_0001"],
+            "block_0002": store.all_annotations()["block_0002"],
+        }
+
+    def test_torn_journal_line_is_ignored(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 2)
+        with open(journal_path(fp), "a", encoding="utf-8") as fh:
+            fh.write('{"op": "set", "block_na')
+
+        store2 = AnnotationStore(fp, "alice")
+        store2.load_or_create()
+        assert store2.annotated_block_ids() == {"block_0001"}
+
+    def test_append_after_torn_journal_line(self, tmp_path: Path) -> None:
+        """A record appended after a torn tail starts on its own line."""
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.set_label("block_0001", 2)
+        with open(journal_path(fp), "a", encoding="utf-8") as fh:
+            fh.write('{"op": "set", "block_na')
+
+        store2 = AnnotationStore(fp, "alice")
+        store2.load_or_create()
+        store2.set_label("block_0002", 3)
+
+        store3 = AnnotationStore(fp, "alice")
+        store3.load_or_create()
+        assert store3.annotated_block_ids() == {"block_0001", "block_0002"}
+        assert store3.get_label("block_0002") == 3
+
+    def test_deferred_flush(self, tmp_path: Path) -> None:
+        """With autoflush off, nothing reaches the journal until flush()."""
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice")
+        store.load_or_create()
+        store.autoflush = False
+        store.set_label("block_0001", 1)
+        store.set_label("block_0002", 2)
+        assert not journal_path(fp).exists()
+        store.flush()
+        assert len(journal_path(fp).read_text().splitlines()) == 2
+
+    def test_background_writer(self, tmp_path: Path) -> None:
+        fp = tmp_path / "alice.json"
+        writer = JsonWriter()
+        store = AnnotationStore(fp, "alice", writer=writer)
+        store.load_or_create()
+        store.set_label("block_0001", 2)
+        store.flush(wait=True)
+        assert load_annotation_file(fp)["annotations"][""]["block_0001"]["label"] == 2
+        store.compact()
+        writer.close()
+        assert not journal_path(fp).exists()
+        assert read_json(fp)["annotations"][""]["block_0001"]["label"] == 2
+
+    def test_storage_key_follows_registry_rescan(self, tmp_path: Path) -> None:
+        """Cached parent paths are invalidated when the registry rescans."""
+        for root in ("a", "b"):
+            (tmp_path / root / "block_0001").mkdir(parents=True)
+        registry = BlockRegistry(tmp_path / "a")
+        registry.scan()
+        store = AnnotationStore(tmp_path / "alice.json", "alice", registry=registry)
+        store.load_or_create()
+        store.set_label("block_0001", 1)
+        assert store.get_label("block_0001") == 1
+
+        registry.rescan(tmp_path / "b")
+        assert store.get_label("block_0001") is None
+
 
 class TestFinalLabelStore:
     def test_load_empty(self, tmp_path: Path) -> None:
@@ -96,3 +250,25 @@ class TestFinalLabelStore:
         store = FinalLabelStore(fp)
         store.load()
         assert store.get_final_label("block_9999") is None
+
+    def test_user_and_final_labels_rekeyed_by_block_id(self, tmp_path: Path) -> None:
+        """Both stores key by absolute path; the admin view needs block ids."""
+        (tmp_path / "data" / "sub" / "block_0001").mkdir(parents=True)
+        registry = BlockRegistry(tmp_path / "data")
+        registry.scan()
+        block_id = "sub/block_0001"
+        block_by_key = {storage_key(block_id, registry): block_id}
+
+        fp = tmp_path / "alice.json"
+        store = AnnotationStore(fp, "alice", registry=registry)
+        store.load_or_create()
+        store.set_label(block_id, 2)
+        store.compact()
+        finals = FinalLabelStore(tmp_path / "final_labels.json", registry=registry)
+        finals.set_final_label(block_id, 3, "admin")
+
+        user_labels = rekey_by_block_id(load_annotation_labels(fp), block_by_key)
+        final_labels = rekey_by_block_id(finals.all_labels(), block_by_key)
+        assert user_labels == {block_id: 2}
+        assert final_labels[block_id]["final_label"] == 3
+        assert rekey_by_block_id(finals.all_labels(), {}) == {}
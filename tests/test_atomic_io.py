@@ -5,7 +5,15 @@ from pathlib import Path
 
 import pytest
 
-from aind_proteomics_annotator.utils.atomic_io import atomic_write_json, read_json
+from aind_proteomics_annotator.utils import atomic_io
+from aind_proteomics_annotator.utils.atomic_io import (
+    JsonWriter,
+    append_jsonl,
+    atomic_write_json,
+    batched_writes,
+    read_json,
+    read_jsonl,
+)
 
 
 def test_round_trip(tmp_path: Path) -> None:
@@ -47,9 +55,94 @@ def test_atomic_write_overwrites_existing(tmp_path: Path) -> None:
     assert result == {"v": 2}
 
 
+def test_read_json_gives_up_on_persistently_corrupt_file(tmp_path: Path) -> None:
+    """Corrupt content is retried within the budget, then reported."""
+    target = tmp_path / "bad.json"
+    target.write_text("{not json", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="attempts"):
+        read_json(target)
+
+
 def test_read_json_parses_valid_file(tmp_path: Path) -> None:
     """read_json correctly parses an existing JSON file."""
     target = tmp_path / "valid.json"
     payload = {"hello": "world"}
     target.write_text(json.dumps(payload), encoding="utf-8")
     assert read_json(target) == payload
+
+
+def test_round_trip_stdlib_fallback(tmp_path: Path, monkeypatch) -> None:
+    """Without orjson the stdlib encoder produces a readable file too."""
+    monkeypatch.setattr(atomic_io, "orjson", None)
+    target = tmp_path / "test.json"
+    data = {"name": "Zoë", "nested": {"a": [1, 2]}}
+    atomic_write_json(target, data)
+    assert json.loads(target.read_text(encoding="utf-8")) == data
+    assert read_json(target) == data
+
+
+def test_batched_and_unsynced_writes(tmp_path: Path) -> None:
+    """Relaxed durability modes still replace the file atomically."""
+    with batched_writes(tmp_path):
+        for i in range(3):
+            atomic_write_json(tmp_path / f"{i}.json", {"i": i}, durability="batched")
+    atomic_write_json(tmp_path / "ui.json", {"x": 1}, durability="none")
+    assert [read_json(tmp_path / f"{i}.json") for i in range(3)] == [
+        {"i": 0},
+        {"i": 1},
+        {"i": 2},
+    ]
+    assert read_json(tmp_path / "ui.json") == {"x": 1}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unknown_durability_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        atomic_write_json(tmp_path / "x.json", {}, durability="eventual")
+
+
+def test_jsonl_append_and_read(tmp_path: Path) -> None:
+    """Appended records are read back in order across calls."""
+    target = tmp_path / "log.jsonl"
+    append_jsonl(target, [{"n": 1}, {"n": 2}])
+    append_jsonl(target, [{"n": 3}])
+    assert read_jsonl(target) == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+def test_read_jsonl_skips_torn_utf8_line(tmp_path: Path) -> None:
+    """A crash mid-append can split a multi-byte character; skip that line."""
+    target = tmp_path / "log.jsonl"
+    append_jsonl(target, [{"name": "Zoë"}])
+    with open(target, "ab") as fh:
+        fh.write('{"name": "Zoë"}'.encode("utf-8")[:12])
+    assert read_jsonl(target) == [{"name": "Zoë"}]
+
+
+def test_read_jsonl_missing_file(tmp_path: Path) -> None:
+    assert read_jsonl(tmp_path / "missing.jsonl") == []
+
+
+def test_json_writer_runs_tasks_in_order(tmp_path: Path) -> None:
+    """Queued snapshots and appends are all on disk after close()."""
+    snap = tmp_path / "snap.json"
+    log = tmp_path / "snap.jsonl"
+    writer = JsonWriter()
+    writer.append_jsonl(log, [{"n": 1}])
+    writer.write_json(snap, {"v": 1}, then_unlink=log)
+    writer.append_jsonl(log, [{"n": 2}])
+    writer.write_json(snap, {"v": 2}, then_unlink=log)
+    writer.close()
+    assert read_json(snap) == {"v": 2}
+    assert read_jsonl(log) == [{"n": 2}]
+
+
+def test_json_writer_rejects_tasks_after_close(tmp_path: Path) -> None:
+    """A late submission fails loudly instead of being silently dropped."""
+    writer = JsonWriter()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.write_json(tmp_path / "late.json", {"v": 1})
+    with pytest.raises(RuntimeError):
+        writer.append_jsonl(tmp_path / "late.jsonl", [{"n": 1}])
+    assert not (tmp_path / "late.json").exists()
+    assert not (tmp_path / "late.jsonl").exists()
@@ -0,0 +1,113 @@
+"""Tests for workers/block_cache.py."""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from aind_proteomics_annotator.workers.block_cache import BlockCache
+
+
+def _arrays(nbytes: int = 100) -> list:
+    return [np.zeros(nbytes, dtype=np.uint8)]
+
+
+def test_user_blocks_survive_preload_flood() -> None:
+    cache = BlockCache(max_size=8)
+    for i in range(4):
+        cache.put(f"user_{i}", _arrays())
+    for i in range(100):
+        cache.put(f"pre_{i}", _arrays(), source="preload")
+    for i in range(4):
+        assert f"user_{i}" in cache
+    assert cache.stats()["blocks"] == 8
+
+
+def test_preloads_do_not_evict_hot_when_hot_is_large() -> None:
+    # Hot holds well over half the cache, as after a long sequential walk.
+    cache = BlockCache(max_size=8)
+    for i in range(6):
+        cache.put(f"user_{i}", _arrays())
+    for i in range(10):
+        cache.put(f"pre_{i}", _arrays(), source="preload")
+    assert all(f"user_{i}" in cache for i in range(6))
+    assert "pre_9" in cache and "pre_0" not in cache
+
+
+def test_user_put_evicts_least_recently_used_hot() -> None:
+    cache = BlockCache(max_size=3)
+    for i in range(3):
+        cache.put(f"user_{i}", _arrays())
+    cache.get("user_0")
+    cache.put("user_3", _arrays())
+    assert "user_1" not in cache
+    assert "user_0" in cache and "user_3" in cache
+
+
+def test_preload_hit_promotes_to_hot() -> None:
+    cache = BlockCache(max_size=4)
+    cache.put("pre", _arrays(), source="preload")
+    assert cache.get("pre") is not None
+    assert cache.stats()["hot_blocks"] == 1
+
+
+def test_byte_budget_eviction() -> None:
+    cache = BlockCache(max_size=100, max_bytes=1000)
+    for i in range(3):
+        cache.put(f"user_{i}", _arrays(400))
+    stats = cache.stats()
+    assert "user_0" not in cache
+    assert stats["blocks"] == 2 and stats["bytes"] == 800
+    assert stats["evictions"] == 1
+
+
+def test_oversized_block_is_kept() -> None:
+    cache = BlockCache(max_size=4, max_bytes=100)
+    cache.put("big", _arrays(500))
+    assert "big" in cache
+
+
+def test_memmapped_entries_count_as_zero_bytes(tmp_path: Path) -> None:
+    mm = np.memmap(tmp_path / "ch0.raw", dtype=np.uint8, mode="w+", shape=(10_000,))
+    cache = BlockCache(max_size=10, max_bytes=1000)
+    cache.put("mapped_0", [mm])
+    cache.put("mapped_1", [mm])
+    cache.put("ram", _arrays(400))
+    stats = cache.stats()
+    assert stats["bytes"] == 400
+    assert stats["blocks"] == 3
+
+
+def test_claim_load_dedupes_in_flight_blocks() -> None:
+    cache = BlockCache(max_size=4)
+    assert cache.claim_load("blk")
+    assert cache.is_loading("blk")
+    assert not cache.claim_load("blk")
+    cache.put("blk", _arrays(), source="preload")
+    cache.end_load("blk")
+    assert not cache.is_loading("blk")
+    assert not cache.claim_load("blk")  # cached now
+
+
+def test_wait_load_adopts_in_flight_result() -> None:
+    cache = BlockCache(max_size=4)
+    assert cache.claim_load("blk")
+    arrays = _arrays()
+
+    def finish() -> None:
+        cache.put("blk", arrays, source="preload")
+        cache.end_load("blk")
+
+    timer = threading.Timer(0.05, finish)
+    timer.start()
+    cache.wait_load("blk", timeout=5)
+    timer.join()
+    assert cache.get("blk") is arrays
+
+
+def test_end_load_without_put_releases_waiters() -> None:
+    cache = BlockCache(max_size=4)
+    assert cache.claim_load("blk")
+    cache.end_load("blk")  # e.g. the decode failed
+    cache.wait_load("blk", timeout=0)
+    assert cache.claim_load("blk")
@@ -68,3 +68,51 @@ class TestBlockRegistry:
         registry = BlockRegistry(root)
         registry.scan()
         assert registry.get_block("block_9999") is None
+
+    def test_neighbors_nearest_first(self, tmp_path: Path) -> None:
+        root = tmp_path / "blocks"
+        for i in range(1, 6):
+            _make_block(root, f"block_000{i}")
+        registry = BlockRegistry(root)
+        registry.scan()
+        ids = [b.block_id for b in registry.neighbors("block_0003", radius=2)]
+        assert ids == ["block_0004", "block_0002", "block_0005", "block_0001"]
+
+    def test_neighbors_clipped_at_edges(self, tmp_path: Path) -> None:
+        root = tmp_path / "blocks"
+        for i in range(1, 4):
+            _make_block(root, f"block_000{i}")
+        registry = BlockRegistry(root)
+        registry.scan()
+        ids = [b.block_id for b in registry.neighbors("block_0001", radius=2)]
+        assert ids == ["block_0002", "block_0003"]
+        assert registry.neighbors("block_9999") == []
+
+    def test_block_index_matches_order(self, tmp_path: Path) -> None:
+        root = tmp_path / "blocks"
+        _make_block(root, "block_0002")
+        _make_block(root, "block_0001")
+        registry = BlockRegistry(root)
+        registry.scan()
+        assert [b.index for b in registry.all_blocks()] == [0, 1]
+        assert registry.get_block("block_0002").index == 1
+
+    def test_scan_nested_folders(self, tmp_path: Path) -> None:
+        root = tmp_path / "blocks"
+        _make_block(root / "sample_b", "block_0001")
+        _make_block(root / "sample_a", "block_0002")
+        _make_block(root, "block_0003")
+        registry = BlockRegistry(root)
+        registry.scan()
+        ids = [b.block_id for b in registry.all_blocks()]
+        assert ids == ["block_0003", "sample_a/block_0002", "sample_b/block_0001"]
+
+    def test_tiff_files_order(self, tmp_path: Path) -> None:
+        block_dir = tmp_path / "blocks" / "block_0001"
+        block_dir.mkdir(parents=True)
+        for name in ("b.tif", "a.tif", "z.tiff", "c.TIFF", "notes.txt"):
+            (block_dir / name).write_bytes(b"TIFF")
+        registry = BlockRegistry(tmp_path / "blocks")
+        registry.scan()
+        names = [p.name for p in registry.get_block("block_0001").tiff_files]
+        assert names == ["c.TIFF", "z.tiff", "a.tif", "b.tif"]
@@ -1,11 +1,17 @@
 """Tests for utils/consensus.py."""
 
+import random
+
+import numpy as np
 import pytest
 
+from aind_proteomics_annotator.utils import consensus_numba
 from aind_proteomics_annotator.utils.consensus import (
     build_consensus_table,
+    build_consensus_table_fast,
     compute_consensus,
 )
+from aind_proteomics_annotator.utils.consensus_numba import compute_consensus_batch
 
 
 class TestComputeConsensus:
@@ -91,3 +97,60 @@ class TestBuildConsensusTable:
         assert len(rows) == 2
         assert rows[0]["block_id"] == "block_0001"
         assert rows[1]["block_id"] == "block_0002"
+
+    def test_bare_int_labels(self) -> None:
+        """Label-only maps (block_id → int) are accepted as well."""
+        all_user = {"alice": {"block_0001": 2}, "bob": {"block_0001": 3}}
+        rows = build_consensus_table(all_user, ["block_0001"])
+        assert rows[0]["user_labels"] == {"alice": 2, "bob": 3}
+        assert rows[0]["consensus"] == 2
+        assert rows[0]["disagreement"] is True
+
+
+class TestBuildConsensusTableFast:
+    def test_matches_reference(self) -> None:
+        rng = random.Random(0)
+        block_ids = [f"block_{i:04d}" for i in range(60)]
+        all_user = {
+            user: {
+                b: rng.choice([{"label": rng.randint(1, 4)}, rng.randint(1, 4), {}])
+                for b in rng.sample(block_ids + ["stale_block"], 40)
+            }
+            for user in ("alice", "bob", "carol", "dave")
+        }
+        assert build_consensus_table_fast(all_user, block_ids) == build_consensus_table(
+            all_user, block_ids
+        )
+
+    def test_no_votes(self) -> None:
+        rows = build_consensus_table_fast({"alice": {}}, ["block_0001"])
+        assert rows == [
+            {
+                "block_id": "block_0001",
+                "user_labels": {},
+                "consensus": None,
+                "disagreement": False,
+            }
+        ]
+
+
+class TestComputeConsensusBatch:
+    def test_rows(self) -> None:
+        mat = np.array([[0, 0, 1], [2, 1, -1], [-1, -1, -1], [3, 3, 3]])
+        consensus, disagreement = compute_consensus_batch(mat)
+        assert consensus.tolist() == [0, 1, -1, 3]
+        assert disagreement.tolist() == [True, True, False, False]
+
+    def test_empty(self) -> None:
+        consensus, disagreement = compute_consensus_batch(np.empty((0, 3), int))
+        assert consensus.shape == disagreement.shape == (0,)
+
+    def test_jit_matches_numpy(self) -> None:
+        if consensus_numba._consensus_kernel is None:
+            pytest.skip("numba not installed")
+        rng = np.random.default_rng(0)
+        mat = rng.integers(-1, 5, size=(500, 7))
+        jit = consensus_numba._consensus_kernel(mat, 5)
+        ref = consensus_numba._consensus_numpy(mat, 5)
+        assert jit[0].tolist() == ref[0].tolist()
+        assert jit[1].tolist() == ref[1].tolist()
@@ -0,0 +1,44 @@
+"""Tests for utils/csv_exporter.py."""
+
+import csv
+from pathlib import Path
+
+from aind_proteomics_annotator.utils.csv_exporter import export_csv
+
+
+def test_export_csv_columns_and_values(tmp_path: Path) -> None:
+    rows = [
+        {
+            "block_id": "block_0001",
+            "user_labels": {"bob": 2, "alice": 1},
+            "consensus": 1,
+            "disagreement": True,
+        },
+        {
+            "block_id": "block_0002",
+            "user_labels": {},
+            "consensus": None,
+            "disagreement": False,
+        },
+    ]
+    out = tmp_path / "export" / "table.csv"
+    export_csv(rows, {"block_0001": {"final_label": 2}}, out, ["bob", "alice"])
+
+    with open(out, newline="", encoding="utf-8") as fh:
+        records = list(csv.DictReader(fh))
+    assert list(records[0]) == [
+        "block_id",
+        "consensus_label",
+        "final_label",
+        "has_disagreement",
+        "user_alice_label",
+        "user_bob_label",
+        "exported_at",
+    ]
+    first, second = records
+    assert (first["consensus_label"], first["final_label"]) == ("1", "2")
+    assert (first["user_alice_label"], first["user_bob_label"]) == ("1", "2")
+    assert first["has_disagreement"] == "True"
+    assert (second["consensus_label"], second["final_label"]) == ("", "")
+    assert second["user_alice_label"] == ""
+    assert first["exported_at"] and first["exported_at"] == second["exported_at"]
@@ -0,0 +1,38 @@
+"""Tests for workers/quantize.py."""
+
+import numpy as np
+
+from aind_proteomics_annotator.workers.quantize import (
+    quantize_channels,
+    quantize_to_uint8,
+)
+
+
+def test_stretches_to_full_uint8_range() -> None:
+    arr = np.linspace(0.0, 1.0, 4096, dtype=np.float32).reshape(4, 32, 32)
+    out = quantize_to_uint8(arr)
+    assert out.dtype == np.uint8
+    assert out.min() == 0 and out.max() == 255
+
+
+def test_nan_does_not_blank_channel() -> None:
+    arr = np.linspace(0.0, 1.0, 4096, dtype=np.float32).reshape(4, 32, 32)
+    arr[0, 0, 0] = np.nan  # lands in the strided sample
+    arr[1, 4, 4] = np.inf
+    out = quantize_to_uint8(arr)
+    assert out[0, 0, 0] == 0
+    assert out[1, 4, 4] == 255
+    assert out.max() == 255 and np.count_nonzero(out) > arr.size // 2
+
+
+def test_all_nan_channel() -> None:
+    out = quantize_to_uint8(np.full((2, 4, 4), np.nan, dtype=np.float32))
+    assert out.dtype == np.uint8 and not out.any()
+
+
+def test_integer_channels_pass_through() -> None:
+    ints = np.arange(8, dtype=np.uint16).reshape(2, 2, 2)
+    floats = np.ones((2, 2, 2), dtype=np.float32)
+    out = quantize_channels([ints, floats])
+    assert out[0] is ints
+    assert out[1].dtype == np.uint8
@@ -0,0 +1,30 @@
+"""Tests for workers/shm_decode.py."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+tifffile = pytest.importorskip("tifffile")
+
+from aind_proteomics_annotator.workers.shm_decode import DecodePool  # noqa: E402
+
+
+def test_decode_pool_round_trip(tmp_path: Path) -> None:
+    """Arrays decoded in subprocesses match the file contents, in order."""
+    a = np.arange(2 * 8 * 8, dtype=np.uint16).reshape(2, 8, 8)
+    b = (a * 3).astype(np.float32)
+    tifffile.imwrite(tmp_path / "c0.tif", a)
+    tifffile.imwrite(tmp_path / "c1.tif", b)
+
+    pool = DecodePool(max_workers=2)
+    try:
+        out = pool.load([tmp_path / "c0.tif", tmp_path / "c1.tif"])
+        np.testing.assert_array_equal(out[0], a)
+        np.testing.assert_array_equal(out[1], b)
+        assert out[1].dtype == np.float32
+
+        with pytest.raises(FileNotFoundError):
+            pool.load([tmp_path / "c0.tif", tmp_path / "missing.tif"])
+    finally:
+        pool.shutdown()
@@ -0,0 +1,43 @@
+"""Tests for models/user_session.py."""
+
+import json
+from pathlib import Path
+
+from aind_proteomics_annotator.config import AppConfig
+from aind_proteomics_annotator.models.user_session import UserSession
+
+
+def _config(tmp_path: Path) -> AppConfig:
+    roles = tmp_path / "roles.json"
+    roles.write_text(json.dumps({"admins": ["alice"]}))
+    return AppConfig(
+        data_root=tmp_path / "blocks",
+        annotations_root=tmp_path / "annotations",
+        roles_file=roles,
+        classes_file=tmp_path / "classes.json",
+    )
+
+
+def test_load_or_create_sets_admin_from_roles(tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    session = UserSession("alice", config, registry=None)
+    session.load_or_create()
+    assert session.is_admin
+    session.close()
+    assert config.user_file("alice").exists()
+
+
+def test_non_admin_user(tmp_path: Path) -> None:
+    session = UserSession("bob", _config(tmp_path), registry=None)
+    session.load_or_create()
+    assert not session.is_admin
+    session.close()
+
+
+def test_class_name_lookup(tmp_path: Path) -> None:
+    session = UserSession("bob", _config(tmp_path), registry=None)
+    assert session.class_name(1) == "Class 1"
+    assert session.class_name(3) == "Class 3"
+    assert session.class_name(0) == ""
+    assert session.class_name(4) == ""
+    assert session.class_name(-1) == ""